@@ -11,12 +11,38 @@ import os
 from datetime import datetime
 from dotenv import load_dotenv
 from utils.llm_helper import explain_failure, classify_flaky_test
+from pages.login_page import LoginPage
+from pages.dashboard_page import TodoDashboard
+from utils.api_client import session_client
+from utils.failure_index import FailureIndex
+from utils.failure_context import extract_failure_context
 
 load_dotenv()
 
+# Project pytest plugins (see utils/)
+pytest_plugins = ["utils.impact", "utils.scheduler", "utils.stream_report", "utils.artifacts",
+                  "utils.rerun_confirm", "utils.metrics", "utils.api_cases"]
+
 # Store failure details for the AI hook
 _failure_store = {}
 
+# Past explanations, reused for near-duplicate failures instead of calling the LLM
+_failure_index = FailureIndex(
+    os.getenv("FAILURE_INDEX_PATH", "reports/failure_index.jsonl"),
+    threshold=float(os.getenv("FAILURE_REUSE_THRESHOLD", "0.8"))
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--api-memo", action="store_true", default=bool(os.getenv("API_MEMO")),
+        help="Reuse GET/HEAD responses across API tests in a session (env: API_MEMO=1)."
+    )
+    parser.addoption(
+        "--no-ai-explain", action="store_false", dest="ai_explain", default=True,
+        help="Disable the AI failure explainer / flaky classifier hook."
+    )
+
 
 def pytest_configure(config):
     """Register custom markers."""
@@ -25,6 +51,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "api: API module tests")
     config.addinivalue_line("markers", "smoke: Smoke tests")
     config.addinivalue_line("markers", "regression: Regression tests")
+    config.addinivalue_line("markers", "live: Always hit the network (bypasses the API response memo)")
 
 
 @pytest.fixture(scope="session")
@@ -37,6 +64,23 @@ def api_base_url():
     return os.getenv("API_BASE_URL", "https://jsonplaceholder.typicode.com")
 
 
+@pytest.fixture(scope="session")
+def api_session_client(api_base_url, pytestconfig):
+    """
+    One pooled API client per session, shared with the *.cases.json API cases;
+    memoizes GET/HEAD when --api-memo is set. Closed by utils/api_cases.py.
+    """
+    return session_client(pytestconfig, api_base_url, memoize=pytestconfig.getoption("api_memo"))
+
+
+@pytest.fixture
+def api_client(api_session_client, request):
+    """API client for a test; tests marked `live` always go to the network."""
+    if request.node.get_closest_marker("live"):
+        return api_session_client.live()
+    return api_session_client
+
+
 @pytest.fixture(scope="session")
 def test_credentials():
     return {
@@ -45,6 +89,37 @@ def test_credentials():
     }
 
 
+def _plugin(config, name: str):
+    """
+    A project plugin module from pytest_plugins (imported by pytest, not here, so
+    it stays rewritable), or None if it was disabled with `-p no:utils.<name>`.
+    """
+    return config.pluginmanager.get_plugin(f"utils.{name}")
+
+
+def _attach_page_timings(request, page_object):
+    """Store a page object's per-action timings on the test for reporting."""
+    summary = page_object.timing_summary()
+    if summary:
+        request.node.user_properties.append(("page_timings", summary))
+
+
+@pytest.fixture
+def login_page(page, request):
+    """LoginPage opened on the login form; action timings land in user_properties."""
+    login = LoginPage(page).open()
+    yield login
+    _attach_page_timings(request, login)
+
+
+@pytest.fixture
+def todo_dashboard(page, request):
+    """TodoDashboard opened on the app; action timings land in user_properties."""
+    dashboard = TodoDashboard(page).open()
+    yield dashboard
+    _attach_page_timings(request, dashboard)
+
+
 @pytest.fixture(autouse=True)
 def track_test(request):
     """Auto-fixture: tracks test name for failure hook."""
@@ -58,39 +133,77 @@ def pytest_runtest_makereport(item, call):
     AI FAILURE EXPLAINER HOOK
     
     Runs after each test phase (setup/call/teardown).
-    If a test fails during 'call' phase, sends failure to LLM for explanation.
+    If a test fails during 'call' phase, reruns it in isolation to confirm the
+    failure, and sends consistent failures to the LLM for explanation.
     """
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
+    if report.when == "call" and report.failed and item.config.getoption("ai_explain"):
         test_name = item.name
-        error_msg = str(report.longrepr) if report.longrepr else "Unknown error"
-        
-        # Truncate for readability
-        error_short = error_msg[:500]
+        # Most relevant parts of the failure, packed into a token budget
+        context = extract_failure_context(report.longrepr, item)
+        error_short = context.error_message
         
         print(f"\n{'='*60}")
         print(f"[AI] FAILURE EXPLAINER - {test_name}")
         print(f"{'='*60}")
         
-        # Get AI explanation
-        explanation = explain_failure(
-            test_name=test_name,
-            error_message=error_short,
-            stack_trace=error_msg[500:1000]
-        )
+        # Confirm with isolated reruns before spending LLM calls on the failure
+        rerun_confirm = _plugin(item.config, "rerun_confirm")
+        confirmation = None
+        if rerun_confirm is not None and item.config.getoption("confirm_runs", 0) > 0:
+            confirmation = rerun_confirm.confirm_failure(item)
+            print(f"[RERUN] {confirmation.verdict} - reruns: {', '.join(confirmation.history)}")
+        
+        if confirmation and confirmation.verdict == rerun_confirm.FLAKY:
+            runs = len(confirmation.history)
+            explanation = (
+                f"[FLAKY] Passed {confirmation.passes}/{runs} isolated reruns - LLM explanation skipped."
+            )
+            classification = {
+                "classification": "FLAKY",
+                "confidence": round(100 * confirmation.passes / runs),
+                "reason": f"Passed {confirmation.passes} of {runs} reruns in fresh browser contexts / API sessions"
+            }
+        else:
+            # Reuse the explanation of a near-identical past failure at the same location
+            match = _failure_index.lookup(error_short, context.location)
+            if match:
+                entry, similarity = match
+                explanation = (
+                    f"[reused from {entry['test']} - {similarity:.0%} similar]\n{entry['explanation']}"
+                )
+                classification = entry.get("classification") or {}
+            else:
+                # Get AI explanation
+                explanation = explain_failure(
+                    test_name=test_name,
+                    error_message=error_short,
+                    stack_trace=context.stack_trace
+                )
+                # Classify if flaky, with the reruns as run history
+                classification = classify_flaky_test(
+                    test_name=test_name,
+                    error_message=error_short,
+                    run_history=["fail"] + (confirmation.history if confirmation else [])
+                )
+                if not explanation.startswith("[LLM Unavailable]"):
+                    _failure_index.add(test_name, error_short, explanation, classification,
+                                       location=context.location)
+
         # Safe print for Windows cp1252
         try:
             print(explanation)
         except UnicodeEncodeError:
             print(explanation.encode("ascii", "replace").decode("ascii"))
         
-        # Classify if flaky
-        classification = classify_flaky_test(
-            test_name=test_name,
-            error_message=error_short
-        )
+        # Link the trace/video archive written after teardown
+        artifacts_plugin = _plugin(item.config, "artifacts")
+        artifacts = artifacts_plugin.planned_artifacts(item) if artifacts_plugin is not None else None
+        if artifacts:
+            print(f"\n[ARTIFACTS]: {artifacts}")
+        
         print(f"\n[FLAKY CLASSIFIER]:")
         print(f"   Classification : {classification.get('classification', 'N/A')}")
         print(f"   Confidence     : {classification.get('confidence', 0)}%")
@@ -100,6 +213,8 @@ def pytest_runtest_makereport(item, call):
         # Attach to report for HTML output
         report.ai_explanation = explanation
         report.ai_classification = classification
+        report.ai_artifacts = artifacts
+        report.ai_rerun_history = confirmation.history if confirmation else None
 
 
 def pytest_html_report_title(report):
@@ -108,9 +223,11 @@ def pytest_html_report_title(report):
 
 @pytest.fixture
 def browser_context_args(browser_context_args):
-    """Extended browser context with common settings."""
+    """
+    Extended browser context with common settings.
+    Video (RECORD_VIDEO=1) and traces are kept for failing tests only - see utils/artifacts.py.
+    """
     return {
         **browser_context_args,
         "viewport": {"width": 1280, "height": 720},
-        "record_video_dir": "reports/videos/" if os.getenv("RECORD_VIDEO") else None,
     }
@@ -0,0 +1 @@
+# Page objects package for TestMu AI SDET
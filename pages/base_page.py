@@ -0,0 +1,51 @@
+"""
+Base Page - Shared plumbing for all page objects:
+1. Holds the Playwright page and builds locators once per page object
+2. Times every user-level action so slow interactions are easy to spot
+"""
+
+import time
+import functools
+from contextlib import contextmanager
+from playwright.sync_api import Page
+
+
+def timed_action(func):
+    """Decorator: records how long a page-object action took in `self.timings`."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.timed(func.__name__):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+class BasePage:
+    """Base class for page objects. Subclasses build their locators in __init__."""
+
+    URL = ""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.timings = []  # list of (action, seconds) in call order
+
+    @contextmanager
+    def timed(self, action: str):
+        """Context manager: times a block and records it under `action`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((action, time.perf_counter() - start))
+
+    @timed_action
+    def open(self):
+        """Navigate to the page's URL."""
+        self.page.goto(self.URL)
+        return self
+
+    def timing_summary(self) -> dict:
+        """Returns total seconds per action, e.g. {'open': 1.21, 'login': 0.08}."""
+        summary = {}
+        for action, seconds in self.timings:
+            summary[action] = round(summary.get(action, 0.0) + seconds, 4)
+        return summary
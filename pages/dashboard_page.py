@@ -0,0 +1,95 @@
+"""
+Todo Dashboard Page Object
+==========================
+Target: https://demo.playwright.dev/todomvc
+"""
+
+from playwright.sync_api import Page
+from pages.base_page import BasePage, timed_action
+
+
+class TodoDashboard(BasePage):
+    """Page object for the TodoMVC dashboard."""
+
+    URL = "https://demo.playwright.dev/todomvc"
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.app = page.locator(".todoapp")
+        self.new_todo = page.locator(".new-todo")
+        self.items = page.locator(".todo-list li")
+        self.active_items = page.locator(".todo-list li:not(.completed)")
+        self.completed_items = page.locator(".todo-list li.completed")
+        self.labels = self.items.locator("label")
+        self.edit_input = self.items.locator(".edit")
+        self.todo_count = page.locator(".todo-count")
+        self.toggle_all_checkbox = page.locator(".toggle-all")
+        self.clear_completed_button = page.locator(".clear-completed")
+        # Attribute selectors instead of text=... so no text scan is needed
+        self.filter_all = page.locator(".filters a[href='#/']")
+        self.filter_active = page.locator(".filters a[href='#/active']")
+        self.filter_completed = page.locator(".filters a[href='#/completed']")
+
+    @timed_action
+    def add_todos(self, *titles: str):
+        """
+        Add one or more todos.
+
+        TodoMVC is a React controlled input, so values set from evaluate()
+        never reach app state - each title goes through fill + Enter.
+        """
+        for title in titles:
+            self.new_todo.fill(title)
+            self.new_todo.press("Enter")
+        return self
+
+    @timed_action
+    def toggle(self, index: int = 0):
+        """Toggle the completed state of the todo at `index` (-1 for last)."""
+        self.item(index).locator(".toggle").click()
+        return self
+
+    @timed_action
+    def delete(self, index: int = 0):
+        """Hover the todo at `index` to reveal its destroy button, then click it."""
+        item = self.item(index)
+        item.hover()
+        item.locator(".destroy").click()
+        return self
+
+    @timed_action
+    def edit(self, index: int, new_title: str):
+        """Double-click the todo at `index` and replace its title."""
+        self.item(index).locator("label").dblclick()
+        self.edit_input.fill(new_title)
+        self.edit_input.press("Enter")
+        return self
+
+    @timed_action
+    def show_all(self):
+        self.filter_all.click()
+        return self
+
+    @timed_action
+    def show_active(self):
+        self.filter_active.click()
+        return self
+
+    @timed_action
+    def show_completed(self):
+        self.filter_completed.click()
+        return self
+
+    @timed_action
+    def clear_completed(self):
+        self.clear_completed_button.click()
+        return self
+
+    @timed_action
+    def toggle_all(self):
+        self.toggle_all_checkbox.click()
+        return self
+
+    def item(self, index: int):
+        """Locator for the todo at `index`; -1 means the last one."""
+        return self.items.last if index == -1 else self.items.nth(index)
@@ -0,0 +1,69 @@
+"""
+Login Page Object
+=================
+Target: https://practicetestautomation.com/practice-test-login/
+"""
+
+from playwright.sync_api import Page
+from pages.base_page import BasePage, timed_action
+
+
+# Sets both credential fields in one browser round-trip; the submit click goes
+# through the locator so it is awaited (and timed) like any other click.
+_BATCHED_FILL_JS = """([username, password]) => {
+    const setValue = (selector, value) => {
+        const el = document.querySelector(selector);
+        el.value = value;
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    };
+    setValue('#username', username);
+    setValue('#password', password);
+}"""
+
+
+class LoginPage(BasePage):
+    """Page object for the practice login form."""
+
+    URL = "https://practicetestautomation.com/practice-test-login/"
+    SUCCESS_URL = "https://practicetestautomation.com/logged-in-successfully/"
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.username_input = page.locator("#username")
+        self.password_input = page.locator("#password")
+        self.submit_button = page.locator("#submit")
+        self.error_message = page.locator("#error")
+        self.heading = page.locator("h1")
+        self.logout_link = page.get_by_role("link", name="Log out")
+
+    @timed_action
+    def login(self, username: str, password: str, batched: bool = True):
+        """
+        Fill username + password and submit.
+
+        The login form is plain HTML with a click handler, so setting the
+        values via a single evaluate() is equivalent to typing them. The
+        submit is always a locator click, which waits for the navigation it
+        starts. Pass batched=False to fill through Playwright's actionability
+        checks as well.
+        """
+        if batched:
+            self.page.evaluate(_BATCHED_FILL_JS, [username, password])
+        else:
+            self.username_input.fill(username)
+            self.password_input.fill(password)
+        self.submit_button.click()
+        return self
+
+    @timed_action
+    def submit(self):
+        """Click submit without touching the fields."""
+        self.submit_button.click()
+        return self
+
+    @timed_action
+    def logout(self):
+        """Click the 'Log out' link on the success page."""
+        self.logout_link.click()
+        return self
@@ -24,9 +24,9 @@ set PYEXIT=%errorlevel%
 echo.
 echo === Done ===
 if %PYEXIT% equ 0 (
-    echo All tests passed. Report: reports\test_report.html
+    echo All tests passed. Report: reports\results.jsonl ^(open reports\viewer.html^)
 ) else (
-    echo Some tests failed. Check output above and reports\test_report.html
+    echo Some tests failed. Check output above and reports\results.jsonl ^(open reports\viewer.html^)
 )
 exit /b %PYEXIT%
 
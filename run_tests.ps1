@@ -7,7 +7,7 @@ Set-Location $ProjectRoot
 
 Write-Host "=== TestMu AI SDET - Setup & Run ===" -ForegroundColor Cyan
 
-# Create reports directory for pytest-html
+# Create reports directory for the streaming report
 if (-not (Test-Path "reports")) {
     New-Item -ItemType Directory -Path "reports" | Out-Null
     Write-Host "Created reports/ directory" -ForegroundColor Green
@@ -30,8 +30,8 @@ $pytestExit = $LASTEXITCODE
 
 Write-Host "`n=== Done ===" -ForegroundColor Cyan
 if ($pytestExit -eq 0) {
-    Write-Host "All tests passed. Report: reports\test_report.html" -ForegroundColor Green
+    Write-Host "All tests passed. Report: reports\results.jsonl (open reports\viewer.html)" -ForegroundColor Green
 } else {
-    Write-Host "Some tests failed. Check output above and reports\test_report.html" -ForegroundColor Red
+    Write-Host "Some tests failed. Check output above and reports\results.jsonl (open reports\viewer.html)" -ForegroundColor Red
 }
 exit $pytestExit
@@ -0,0 +1,96 @@
+"""
+API Case Compiler Unit Tests
+============================
+Offline checks for the schema and row compilers in utils/api_cases.py.
+"""
+
+import pytest
+from utils.api_cases import ApiCaseSpecError, _subset_mismatch, compile_case, compile_schema
+
+
+pytestmark = pytest.mark.unit
+
+POST = {
+    "type": "object",
+    "required": ["id", "title"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "title": {"type": "string", "minLength": 1},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+    },
+}
+
+
+@pytest.mark.parametrize("value", [
+    {"id": 1, "title": "x"},
+    {"id": 7, "title": "x", "tags": ["a", "b"], "extra": None},
+])
+def test_valid_values_pass(value):
+    assert compile_schema(POST)(value) is None
+
+
+@pytest.mark.parametrize("value, error", [
+    ([], "$: expected object, got list"),
+    ({"title": "x"}, "$: missing keys ['id']"),
+    ({"id": 0, "title": "x"}, "$.id: 0 < 1"),
+    ({"id": True, "title": "x"}, "$.id: expected integer, got bool"),
+    ({"id": 1, "title": ""}, "$.title: shorter than 1"),
+    ({"id": 1, "title": "x", "tags": ["a", 2]}, "$.tags[1]: expected string, got int"),
+    ({"id": 1, "title": "x", "tags": ["a", "b", "c"]}, "$.tags: 3 items, expected at most 2"),
+])
+def test_first_violation_is_reported_with_its_path(value, error):
+    assert compile_schema(POST)(value) == error
+
+
+def test_enum_const_and_closed_objects():
+    validate = compile_schema({
+        "type": "object",
+        "properties": {"kind": {"enum": ["a", "b"]}, "v": {"const": 1}},
+        "additionalProperties": False,
+    })
+    assert validate({"kind": "a", "v": 1}) is None
+    assert validate({"kind": "c"}) == "$.kind: 'c' not in ['a', 'b']"
+    assert validate({"v": 2}) == "$.v: expected 1, got 2"
+    assert validate({"other": 1}) == "$: unexpected keys ['other']"
+
+
+def test_identical_schemas_compile_once():
+    assert compile_schema(dict(POST)) is compile_schema(POST)
+
+
+@pytest.mark.parametrize("schema, message", [
+    ({"type": "object", "pattern": "x"}, "unsupported schema keywords"),
+    ({"type": "decimal"}, "unknown schema type"),
+    ({"properties": {"id": {"format": "uuid"}}}, "unsupported schema keywords"),
+    ([], "schema must be an object"),
+])
+def test_unsupported_schemas_are_spec_errors(schema, message):
+    with pytest.raises(ApiCaseSpecError, match=message):
+        compile_schema(schema)
+
+
+def test_case_rows_get_defaults_and_named_schemas():
+    case = compile_case({"method": "get", "path": "/posts/1", "schema": "post"}, {"post": POST}, {"headers": {"X": "1"}})
+    assert case["method"] == "GET"
+    assert case["expected_status"] == 200
+    assert case["headers"] == {"X": "1"}
+    assert case["validator"] is compile_schema(POST)
+
+
+@pytest.mark.parametrize("row, message", [
+    ({"path": "/posts"}, "missing 'method'"),
+    ({"method": "GET", "path": "/posts", "schema": "nope"}, "unknown schema 'nope'"),
+    ({"method": "TRACE", "path": "/posts"}, "unsupported method TRACE"),
+    ({"method": "GET", "path": "/posts", "expected_status": "200"}, "'expected_status' must be"),
+    ({"method": "GET", "path": "/posts", "retries": 3}, "unknown keys"),
+    ("GET /posts", "case must be an object"),
+])
+def test_malformed_rows_are_spec_errors(row, message):
+    with pytest.raises(ApiCaseSpecError, match=message):
+        compile_case(row, {}, {})
+
+
+def test_expected_body_is_a_subset_match():
+    assert _subset_mismatch({"id": 1}, {"id": 1, "title": "x"}) is None
+    assert _subset_mismatch({"user": {"id": 2}}, {"user": {"id": 3}}) == "$.user.id: expected 2, got 3"
+    assert _subset_mismatch([1, 2], [1]) == "$: expected [1, 2], got [1]"
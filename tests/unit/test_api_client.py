@@ -0,0 +1,161 @@
+"""
+API Client Unit Tests
+=====================
+Offline checks for the response memo in utils/api_client.py, driven through a
+fake session instead of the network.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.api_client import ApiClient
+
+
+pytestmark = pytest.mark.unit
+
+BASE_URL = "https://api.test"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body):
+        self.status_code = status_code
+        self._body = body
+        self.json_calls = 0
+
+    def json(self):
+        self.json_calls += 1
+        return self._body
+
+
+class FakeSession:
+    """Records requests; `gate` (if set) holds every request until released."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.calls = []
+        self.gate = None
+        self.entered = threading.Event()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url))
+        self.entered.set()
+        if self.gate is not None:
+            assert self.gate.wait(5)
+        return FakeResponse(self.status_code, {"url": url})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session):
+    return ApiClient(BASE_URL, memoize=True, session=session)
+
+
+def test_identical_gets_are_sent_once(client, session):
+    first = client.get("/posts/1")
+    second = client.get("/posts/1")
+    assert first is second
+    assert first.json() is second.json()
+    assert first._response.json_calls == 1
+    assert len(session.calls) == client.network_calls == 1
+
+
+def test_params_and_headers_are_part_of_the_key(client, session):
+    client.get("/posts", params={"userId": 1})
+    client.get("/posts", params={"userId": 2})
+    client.get("/posts", params={"userId": 1}, headers={"X-Trace": "1"})
+    client.get("/posts", params={"userId": 1})
+    assert client.network_calls == 3
+
+
+def test_concurrent_duplicates_share_one_call(client, session):
+    session.gate = threading.Event()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(client.get, "/posts/1") for _ in range(8)]
+        assert session.entered.wait(5)
+        session.gate.set()
+        responses = [future.result(timeout=5) for future in futures]
+    assert len(session.calls) == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_failed_leader_propagates_and_is_not_memoized(client, session):
+    original = session.request
+
+    def boom(method, url, **kwargs):
+        session.request = original
+        raise ConnectionError("reset")
+    session.request = boom
+    with pytest.raises(ConnectionError):
+        client.get("/posts/1")
+    assert client.get("/posts/1").status_code == 200
+    assert client.network_calls == 2
+
+
+@pytest.mark.parametrize("status_code", [301, 404, 500])
+def test_only_2xx_responses_are_memoized(status_code):
+    session = FakeSession(status_code)
+    client = ApiClient(BASE_URL, memoize=True, session=session)
+    client.get("/posts/1")
+    client.get("/posts/1")
+    assert client.network_calls == 2
+
+
+@pytest.mark.parametrize("method, path, evicted, kept", [
+    ("PATCH", "/posts/1", ["/posts/1", "/posts/1/comments", "/posts"], ["/posts/2", "/users/1"]),
+    ("POST", "/posts", ["/posts", "/posts/1", "/posts/1/comments"], ["/users/1"]),
+    ("DELETE", "/posts/2", ["/posts/2", "/posts"], ["/posts/1", "/posts/1/comments"]),
+])
+def test_writes_evict_their_path(client, session, method, path, evicted, kept):
+    paths = ["/posts", "/posts/1", "/posts/1/comments", "/posts/2", "/users/1"]
+    for p in paths:
+        client.get(p)
+    client.get("/posts", params={"userId": 1})
+    client.request(method, path, json={})
+    session.calls.clear()
+    for p in paths:
+        client.get(p)
+    refetched = {url[len(BASE_URL):] for _, url in session.calls}
+    assert set(evicted) <= refetched
+    assert not set(kept) & refetched
+
+
+def test_get_overlapping_a_write_is_not_memoized(client, session):
+    gate = session.gate = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(client.get, "/posts/1")
+        assert session.entered.wait(5)
+        session.gate = None  # the GET stays parked on `gate`; the write goes through
+        client.patch("/posts/1", json={"title": "new"})
+        gate.set()
+        pending.result(timeout=5)
+    client.get("/posts/1")
+    assert [method for method, _ in session.calls] == ["GET", "PATCH", "GET"]
+
+
+def test_live_view_bypasses_the_memo(client, session):
+    client.get("/posts/1")
+    client.live().get("/posts/1")
+    assert len(session.calls) == 2
+
+
+def test_each_thread_gets_its_own_session():
+    client = ApiClient(BASE_URL)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        barrier = threading.Barrier(4)
+
+        def session_of_thread():
+            barrier.wait(5)  # keep all four threads alive at once
+            return client.session
+        sessions = list(pool.map(lambda _: session_of_thread(), range(4)))
+    assert len({id(s) for s in sessions}) == 4
+    assert client.live().session is client.session  # the live view shares the pool
+    client.close()
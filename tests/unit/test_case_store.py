@@ -0,0 +1,51 @@
+"""
+Case Store Unit Tests
+=====================
+Offline checks for utils/case_store.py: file naming, freshness and atomic writes.
+"""
+
+import os
+import pytest
+from utils.case_store import CaseStore, module_key, slugify
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CaseStore(str(tmp_path / "cases"))
+
+
+def test_names_sharing_a_slug_get_distinct_files(store):
+    names = ["Todo List", "todo-list", "TODO_list", "todo list!"]
+    assert len({slugify(name) for name in names}) == 1
+    assert len({module_key(name) for name in names}) == len(names)
+    for i, name in enumerate(names):
+        store.put(name, f"description {i}", [{"test_id": f"TC{i}"}])
+    for i, name in enumerate(names):
+        assert store.get(name)["test_cases"] == [{"test_id": f"TC{i}"}]
+
+
+def test_file_name_stays_readable(store):
+    path = store._path("Login Page")
+    assert os.path.basename(path).startswith("login_page_")
+    assert path.endswith(".json")
+    assert module_key("!!!").startswith("module_")
+
+
+def test_is_current_tracks_the_description(store):
+    assert not store.is_current("Login", "v1")
+    store.put("Login", "v1", [])
+    assert store.is_current("Login", "v1")
+    assert not store.is_current("Login", "v2")
+
+
+def test_put_leaves_no_temp_files(store):
+    store.put("Login", "v1", [{"test_id": "TC001"}])
+    assert [name for name in os.listdir(store.directory) if name.endswith(".tmp")] == []
+
+
+def test_suffix_is_used_for_api_case_files(tmp_path):
+    api_store = CaseStore(str(tmp_path), suffix=".cases.json")
+    assert api_store._path("Posts API").endswith(".cases.json")
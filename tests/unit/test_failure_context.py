@@ -0,0 +1,98 @@
+"""
+Failure Context Unit Tests
+==========================
+Offline checks for `failure_location()` in utils/failure_context.py.
+
+A small suite with a probe conftest runs in a subprocess, so the locations are
+computed from real pytest reports under the traceback style being tested.
+"""
+
+import os
+import sys
+import json
+import textwrap
+import subprocess
+import pytest
+
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROBE_CONFTEST = '''
+import json
+import pytest
+from utils.failure_context import failure_location
+
+LOCATIONS = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = (yield).get_result()
+    if report.failed and report.when == "call":
+        LOCATIONS[item.name] = failure_location(report.longrepr, item)
+
+
+def pytest_sessionfinish(session):
+    with open("locations.json", "w") as f:
+        json.dump(LOCATIONS, f)
+'''
+
+FAILING_TESTS = '''
+def check_status(status):
+    assert status == 200
+
+
+def test_first_assert():
+    status = 500
+    assert status == 200
+
+
+def test_second_assert():
+    code = 500
+    assert code == 200
+
+
+def test_helper_a():
+    check_status(500)
+
+
+def test_helper_b():
+    check_status(404)
+'''
+
+
+def _locations(tmp_path, tb: str) -> dict:
+    (tmp_path / "conftest.py").write_text(PROBE_CONFTEST)
+    (tmp_path / "test_failures.py").write_text(textwrap.dedent(FAILING_TESTS))
+    env = {**os.environ, "PYTEST_ADDOPTS": "", "PYTHONPATH": ROOT}
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", f"--tb={tb}", "test_failures.py"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120
+    )
+    with open(tmp_path / "locations.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module", params=["short", "long"])
+def locations(request, tmp_path_factory):
+    return _locations(tmp_path_factory.mktemp(f"tb_{request.param}"), request.param)
+
+
+def test_location_is_path_function_and_failing_line(locations):
+    assert locations["test_first_assert"] == "test_failures.py::test_first_assert: assert status == 200"
+    assert locations["test_second_assert"] == "test_failures.py::test_second_assert: assert code == 200"
+
+
+def test_shared_helper_line_is_one_location(locations):
+    expected = "test_failures.py::check_status: assert status == 200"
+    assert locations["test_helper_a"] == locations["test_helper_b"] == expected
+
+
+def test_without_traceback_falls_back_to_nodeid():
+    from utils.failure_context import failure_location
+
+    class Item:
+        nodeid = "tests/test_x.py::test_y"
+    assert failure_location("plain string longrepr", Item()) == "tests/test_x.py::test_y"
@@ -0,0 +1,130 @@
+"""
+Failure Index Unit Tests
+========================
+Offline checks for utils/failure_index.py: normalization, MinHash/LSH
+similarity and location scoping.
+"""
+
+import time
+import random
+import pytest
+from utils.failure_index import (
+    MAX_SHINGLES, NUM_PERM, FailureIndex, minhash, normalize_error, shingles,
+)
+
+
+pytestmark = pytest.mark.unit
+
+TIMEOUT_ERROR = (
+    'TimeoutError: Locator.click: Timeout 30000ms exceeded.\n'
+    'Call log:\n  - waiting for locator("#submit-{n}")\n'
+    '  - locator resolved to <button id="submit" class="btn">Submit</button>\n'
+    '  - attempting click action\n  - element is not visible - waiting...\n'
+    '  at /home/runner/work/repo/pages/login_page.py:{line}'
+)
+LOCATION = "pages/login_page.py: self.submit_button.click()"
+
+
+def _error(n=1, line=61):
+    return TIMEOUT_ERROR.format(n=n, line=line)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return FailureIndex(str(tmp_path / "failure_index.jsonl"))
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+def test_run_specific_details_become_placeholders():
+    assert normalize_error(_error(n=1, line=61)) == normalize_error(_error(n=2, line=99))
+    normalized = normalize_error("GET https://x.test/posts/7 failed at 0x7f3a in '/tmp/a.py'")
+    assert "url" in normalized.split() and "hex" in normalized.split() and "str" in normalized.split()
+    assert not any(char.isdigit() for char in normalized)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("assert 404 == 200", "assert 500 == 200"),
+    ("assert response.status_code == 201", "assert response.status_code == 204"),
+    ("AssertionError: assert 3 > 5", "AssertionError: assert 3 > 7"),
+    ("assert -1.5 <= 0", "assert 1.5 <= 0"),
+])
+def test_numbers_in_comparisons_are_kept(first, second):
+    assert normalize_error(first) != normalize_error(second)
+
+
+def test_numbers_outside_comparisons_are_dropped():
+    assert normalize_error("Timeout 30000ms exceeded") == normalize_error("Timeout 5000ms exceeded")
+
+
+# ---------------------------------------------------------------------------
+# MinHash
+# ---------------------------------------------------------------------------
+
+def test_signature_is_stable_and_sized():
+    signature = minhash(shingles(normalize_error(_error())))
+    assert len(signature) == NUM_PERM
+    assert signature == minhash(shingles(normalize_error(_error())))
+    assert minhash(set()) == minhash(shingles(""))
+
+
+def test_short_errors_still_get_a_shingle():
+    assert len(shingles("assert false")) == 1
+    assert shingles("") == set()
+
+
+def test_long_errors_are_signed_from_a_bounded_sample():
+    rng = random.Random(3)
+    words = [f"word{chr(97 + i % 26)}{chr(97 + i // 26)}" for i in range(400)]
+    text = " ".join(rng.choice(words) for _ in range(300))
+    hashed = shingles(normalize_error(text))
+    assert len(hashed) > MAX_SHINGLES
+    start = time.perf_counter()
+    for _ in range(50):
+        minhash(hashed)
+    assert (time.perf_counter() - start) / 50 < 0.005  # generous bound; ~0.3 ms locally
+
+
+# ---------------------------------------------------------------------------
+# Index: similarity, threshold and location scoping
+# ---------------------------------------------------------------------------
+
+def test_near_duplicate_reuses_explanation(index):
+    index.add("test_a", _error(n=1), "submit hidden", location=LOCATION)
+    match = index.lookup(_error(n=2, line=80) + "\n  - retrying click action", LOCATION)
+    assert match is not None
+    entry, similarity = match
+    assert entry["explanation"] == "submit hidden"
+    assert index.threshold <= similarity <= 1.0
+
+
+def test_exact_duplicate_scores_one(index):
+    index.add("test_a", _error(n=1), "submit hidden", location=LOCATION)
+    assert index.lookup(_error(n=5), LOCATION)[1] == 1.0
+
+
+def test_unrelated_error_is_not_reused(index):
+    index.add("test_a", _error(), "submit hidden", location=LOCATION)
+    assert index.lookup("KeyError: 'userId' while parsing the users response body", LOCATION) is None
+
+
+def test_different_compared_values_are_not_reused(index):
+    index.add("test_a", "assert 404 == 200\n where 404 = response.status_code", "missing", location=LOCATION)
+    assert index.lookup("assert 500 == 200\n where 500 = response.status_code", LOCATION) is None
+
+
+def test_same_error_at_another_location_is_not_reused(index):
+    index.add("test_a", "assert 3 == 4", "off by one", location="tests/test_a.py: assert total == 4")
+    assert index.lookup("assert 3 == 4", "tests/test_b.py: assert count == 4") is None
+    assert index.lookup("assert 3 == 4", "tests/test_a.py: assert total == 4") is not None
+
+
+def test_entries_persist_and_torn_lines_are_skipped(index):
+    index.add("test_a", _error(), "submit hidden", location=LOCATION)
+    with open(index.path, "a", encoding="utf-8") as f:
+        f.write('{"test": "torn')
+    reloaded = FailureIndex(index.path)
+    assert len(reloaded) == 1
+    assert reloaded.lookup(_error(n=9), LOCATION)[0]["test"] == "test_a"
@@ -0,0 +1,222 @@
+"""
+Impact Selection Unit Tests
+===========================
+Offline checks for utils/impact.py - no browser, no network.
+
+Diff parsing runs against a throwaway git repo in tmp_path, and the symbol
+graph against two small modules written there.
+
+The end-to-end dependency map is built by a real `pytest --collect-only` over this repo,
+so regressions in how fixtures and plugins are resolved show up here.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import pytest
+from utils.impact import (
+    ALL_SYMBOLS, MODULE_SCOPE, SymbolGraph, git_changed_symbols, is_affected,
+)
+
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+API_ORIGIN = "https://jsonplaceholder.typicode.com"
+
+
+def _collect(tmp_path, *args) -> tuple:
+    """Run `pytest --collect-only` in the repo; returns (stdout, dependency map)."""
+    map_path = tmp_path / "impact_map.json"
+    env = {**os.environ, "PYTEST_ADDOPTS": ""}
+    env.pop("API_BASE_URL", None)
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=",
+         "-p", "no:cacheprovider", f"--impact-map={map_path}", *args, "tests/api", "tests/login"],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    with open(map_path, encoding="utf-8") as f:
+        return result.stdout, json.load(f)["tests"]
+
+
+@pytest.fixture(scope="module")
+def origin_run(tmp_path_factory):
+    return _collect(tmp_path_factory.mktemp("impact"), f"--impact-origin={API_ORIGIN}")
+
+
+def _api_tests(mapping: dict) -> dict:
+    return {nodeid: entry for nodeid, entry in mapping.items() if nodeid.startswith("tests/api/test_api.py")}
+
+
+def _case_items(mapping: dict) -> dict:
+    return {nodeid: entry for nodeid, entry in mapping.items() if ".cases.json::" in nodeid}
+
+
+def test_origin_selects_fixture_and_spec_api_tests(origin_run):
+    """--impact-origin must see the API origin through the api_client fixture chain and spec items."""
+    stdout, mapping = origin_run
+    api_tests, cases = _api_tests(mapping), _case_items(mapping)
+    assert api_tests and cases
+    for nodeid, entry in {**api_tests, **cases}.items():
+        assert API_ORIGIN in entry["origins"], nodeid
+    assert f"impact: selected {len(api_tests) + len(cases)}," in stdout
+
+
+@pytest.mark.parametrize("changes", [
+    {"utils/api_client.py": {"ApiClient"}},
+    {"utils/api_client.py": {"session_client"}},
+])
+def test_api_client_change_selects_every_api_test(origin_run, changes):
+    """Tests using the client through the fixture must be affected, not only the spec items."""
+    _, mapping = origin_run
+    for nodeid, entry in {**_api_tests(mapping), **_case_items(mapping)}.items():
+        assert is_affected(entry["deps"], changes), nodeid
+
+
+def test_api_client_change_skips_ui_tests(origin_run):
+    _, mapping = origin_run
+    ui_tests = [entry for nodeid, entry in mapping.items() if nodeid.startswith("tests/login/")]
+    assert ui_tests
+    assert not any(is_affected(entry["deps"], {"utils/api_client.py": {"ApiClient"}}) for entry in ui_tests)
+
+
+# ---------------------------------------------------------------------------
+# Diff hunks -> changed symbols
+# ---------------------------------------------------------------------------
+
+HELPERS_V1 = '''\
+import os
+
+TIMEOUT = 30
+
+
+def greet(name):
+    return f"hello {name}"
+
+
+class Client:
+    def get(self):
+        return greet("client")
+'''
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=unit", "-c", "user.email=unit@example.com", *args],
+        cwd=repo, check=True, capture_output=True
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A throwaway git repo with one committed helper module and a data file."""
+    (tmp_path / "helpers.py").write_text(HELPERS_V1)
+    (tmp_path / "data.json").write_text("{}\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+def test_hunk_inside_function_touches_only_that_symbol(repo):
+    (repo / "helpers.py").write_text(HELPERS_V1.replace('f"hello {name}"', 'f"hi {name}"'))
+    assert git_changed_symbols(str(repo), "HEAD") == {"helpers.py": {"greet"}}
+
+
+def test_hunk_in_method_touches_enclosing_class(repo):
+    (repo / "helpers.py").write_text(HELPERS_V1.replace('greet("client")', 'greet("api")'))
+    assert git_changed_symbols(str(repo), "HEAD") == {"helpers.py": {"Client"}}
+
+
+def test_module_level_change_and_pure_deletion(repo):
+    source = HELPERS_V1.replace("TIMEOUT = 30", "TIMEOUT = 60").replace("import os\n", "")
+    (repo / "helpers.py").write_text(source)
+    assert git_changed_symbols(str(repo), "HEAD") == {"helpers.py": {MODULE_SCOPE}}
+
+
+def test_added_deleted_and_data_files_change_everything(repo):
+    (repo / "new_module.py").write_text("def f():\n    pass\n")
+    _git(repo, "add", "new_module.py")  # untracked files are not part of `git diff`
+    (repo / "data.json").write_text('{"a": 1}\n')
+    (repo / "helpers.py").unlink()
+    assert git_changed_symbols(str(repo), "HEAD") == {
+        "new_module.py": {ALL_SYMBOLS},
+        "data.json": {ALL_SYMBOLS},
+        "helpers.py": {ALL_SYMBOLS},
+    }
+
+
+def test_unknown_base_raises(repo):
+    with pytest.raises(RuntimeError, match="git diff failed"):
+        git_changed_symbols(str(repo), "no-such-ref")
+
+
+# ---------------------------------------------------------------------------
+# Symbol graph + affectedness
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def graph_modules(tmp_path, monkeypatch):
+    """Two importable modules: `impact_unit_pages` uses `impact_unit_base.BasePage`."""
+    (tmp_path / "impact_unit_base.py").write_text(
+        "def timed(fn):\n    return fn\n\n\n"
+        "class BasePage:\n    @timed\n    def open(self):\n        return self\n\n\n"
+        "def unused():\n    return 1\n"
+    )
+    (tmp_path / "impact_unit_pages.py").write_text(
+        "from impact_unit_base import BasePage\n\n\n"
+        "class LoginPage(BasePage):\n    pass\n\n\n"
+        "def standalone():\n    return 2\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("impact_unit_base", "impact_unit_pages"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    import impact_unit_pages
+    yield SymbolGraph(str(tmp_path)), impact_unit_pages
+    for name in ("impact_unit_base", "impact_unit_pages"):
+        sys.modules.pop(name, None)
+
+
+def test_symbol_deps_follow_imports_transitively(graph_modules):
+    graph, pages = graph_modules
+    deps = graph.symbol_deps(pages, "LoginPage")
+    assert {
+        "impact_unit_pages.py::LoginPage", "impact_unit_pages.py::<module>",
+        "impact_unit_base.py::BasePage", "impact_unit_base.py::timed", "impact_unit_base.py::<module>",
+    } <= deps
+    assert "impact_unit_base.py::unused" not in deps
+    assert "impact_unit_pages.py::standalone" not in deps
+
+
+def test_symbol_spans_include_decorators(graph_modules):
+    graph, pages = graph_modules
+    symbols = graph.module_symbols(os.path.join(graph.rootdir, "impact_unit_base.py"))
+    assert symbols["BasePage"][:2] == (5, 8)
+    assert "timed" in symbols["BasePage"][2]
+
+
+def test_relpath_rejects_files_outside_the_repo(graph_modules):
+    graph, _ = graph_modules
+    assert graph.relpath(os.path.join(graph.rootdir, "impact_unit_base.py")) == "impact_unit_base.py"
+    assert graph.relpath(os.__file__) is None
+    assert graph.relpath(None) is None
+
+
+@pytest.mark.parametrize("changes, affected", [
+    ({"impact_unit_base.py": {"BasePage"}}, True),
+    ({"impact_unit_base.py": {"unused"}}, False),
+    ({"impact_unit_base.py": {MODULE_SCOPE}}, True),
+    ({"impact_unit_base.py": {ALL_SYMBOLS}}, True),
+    ({"impact_unit_pages.py": {"standalone"}}, False),
+    ({"other.py": {ALL_SYMBOLS}}, False),
+])
+def test_is_affected(graph_modules, changes, affected):
+    graph, pages = graph_modules
+    assert is_affected(graph.symbol_deps(pages, "LoginPage"), changes) is affected
+
+
+def test_whole_file_dependency_matches_any_change():
+    assert is_affected({"tests/data/users.json"}, {"tests/data/users.json": {"<module>"}})
+    assert not is_affected({"tests/data/users.json"}, {"tests/data/users.json": set()})
@@ -0,0 +1,77 @@
+"""
+Scheduler Unit Tests
+====================
+Offline checks for utils/scheduler.py: LPT sharding and shard history merging.
+"""
+
+import random
+import pytest
+from utils.scheduler import DEFAULT_DURATION, assign_shards, expected_durations, merge_histories
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def durations():
+    rng = random.Random(7)
+    return {f"tests/test_{i:03d}.py::test_case": round(rng.uniform(0.05, 12.0), 3) for i in range(200)}
+
+
+@pytest.mark.parametrize("shards", [1, 2, 3, 7])
+def test_every_test_lands_in_exactly_one_shard(durations, shards):
+    assignment = assign_shards(durations, shards)
+    assert set(assignment) == set(durations)
+    assert set(assignment.values()) == set(range(shards))
+
+
+@pytest.mark.parametrize("shards", [2, 3, 7])
+def test_shards_are_balanced(durations, shards):
+    """LPT keeps every shard within one longest test of the ideal load."""
+    assignment = assign_shards(durations, shards)
+    loads = [0.0] * shards
+    for nodeid, shard in assignment.items():
+        loads[shard] += durations[nodeid]
+    assert max(loads) - min(loads) <= max(durations.values())
+    assert max(loads) <= sum(durations.values()) / shards + max(durations.values())
+
+
+def test_assignment_is_deterministic_and_order_independent(durations):
+    reordered = dict(reversed(list(durations.items())))
+    assert assign_shards(durations, 3) == assign_shards(reordered, 3)
+
+
+def test_longest_tests_spread_over_shards():
+    assignment = assign_shards({"a": 10.0, "b": 9.0, "c": 8.0, "d": 1.0}, 3)
+    assert len({assignment["a"], assignment["b"], assignment["c"]}) == 3
+    assert assignment["d"] == assignment["c"]  # lightest shard after the first three
+
+
+def test_more_shards_than_tests_leaves_shards_empty():
+    assert sorted(assign_shards({"a": 1.0, "b": 1.0}, 4).values()) == [0, 1]
+
+
+def test_unknown_tests_get_the_median_duration():
+    history = {"a": {"duration": 1.0}, "b": {"duration": 3.0}, "c": {"duration": 8.0}}
+    assert expected_durations(["a", "new"], history) == {"a": 1.0, "new": 3.0}
+    assert expected_durations(["new"], {}) == {"new": DEFAULT_DURATION}
+
+
+def test_merge_takes_each_changed_entry_from_its_shard():
+    base = {
+        "a": {"duration": 1.0, "runs": 1, "failures": 0},
+        "b": {"duration": 2.0, "runs": 1, "failures": 0},
+    }
+    shard0 = {**base, "a": {"duration": 1.5, "runs": 2, "failures": 0}}
+    shard1 = {**base, "b": {"duration": 3.0, "runs": 2, "failures": 1}, "c": {"duration": 0.5, "runs": 1, "failures": 0}}
+    merged = merge_histories(base, [shard0, shard1])
+    assert merged == {"a": shard0["a"], "b": shard1["b"], "c": shard1["c"]}
+    assert base["a"] == {"duration": 1.0, "runs": 1, "failures": 0}  # base is not mutated
+
+
+def test_merge_prefers_more_runs_when_shards_disagree():
+    base = {"a": {"duration": 1.0, "runs": 1, "failures": 0}}
+    once = {"a": {"duration": 2.0, "runs": 2, "failures": 0}}
+    twice = {"a": {"duration": 3.0, "runs": 3, "failures": 1}}
+    assert merge_histories(base, [twice, once])["a"] == twice["a"]
+    assert merge_histories(base, [once, twice])["a"] == twice["a"]
@@ -0,0 +1,387 @@
+"""
+API Case Compiler - pytest plugin that turns declarative API case specs into test items.
+
+1. Collect: every `*.cases.json` file under the test paths is compiled into one
+   pytest item per row - no Python per case. A file is either a list of rows or
+   an object {"schemas": {...}, "defaults": {...}, "test_cases": [...]}, which is
+   also the format `generate_test_cases.py --api-cases` writes.
+2. Compile: response schemas (a JSON Schema subset) are compiled into validator
+   closures once and shared by every row that uses them.
+3. Run: all selected read-only cases (GET/HEAD/OPTIONS) send their requests
+   concurrently through the session's pooled ApiClient (the same one
+   `api_client` uses, memo included) as soon as the first case runs; each item
+   then only checks its response. Writes run at their own turn, in file order,
+   unless a row opts in with "concurrent": true.
+
+Timing: a prefetched case's call phase is the time spent waiting for its
+response, so the first case's call also absorbs the other requests' queueing.
+Each request's own latency is recorded per item as the `api_request_seconds`
+user property (streamed report `perf`).
+
+A row:
+    {"test_id": "TC221", "title": "Get post 1", "method": "GET", "path": "/posts/1",
+     "params": {}, "body": null, "headers": {}, "expected_status": 200,
+     "schema": "post" | {...}, "expected_body": {"id": 1},
+     "markers": ["smoke"], "live": false, "concurrent": true}
+
+"concurrent" defaults to true for GET/HEAD/OPTIONS and false otherwise.
+
+A malformed row becomes a failing item, so one bad generated row never blocks
+the rest of the file.
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.api_client import ApiClient, session_client
+from utils.case_store import slugify
+
+
+API_BASE_URL = os.getenv("API_BASE_URL", "https://jsonplaceholder.typicode.com")
+CASE_FILE_SUFFIX = ".cases.json"
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+CONCURRENT_METHODS = {"GET", "HEAD", "OPTIONS"}  # safe to reorder against each other
+CASE_KEYS = {
+    "test_id", "title", "category", "steps", "expected_result", "method", "path", "params",
+    "body", "headers", "expected_status", "schema", "expected_body", "markers", "live", "concurrent",
+}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api-cases", "declarative API cases")
+    group.addoption(
+        "--api-case-workers", type=int, default=int(os.getenv("API_CASE_WORKERS", "8")), metavar="N",
+        help="Concurrent requests for *.cases.json API cases (default: 8, 1 = sequential)."
+    )
+
+
+class ApiCaseSpecError(Exception):
+    """A case row or schema that cannot be compiled."""
+
+
+class ApiCaseFailure(AssertionError):
+    """A response that does not match its case."""
+
+
+# ---------------------------------------------------------------------------
+# Schema compiler
+# ---------------------------------------------------------------------------
+
+_TYPES = {
+    "object": dict, "array": list, "string": str, "boolean": bool,
+    "integer": int, "number": (int, float), "null": type(None),
+}
+_SCHEMA_KEYS = {
+    "type", "enum", "const", "required", "properties", "additionalProperties", "items",
+    "minItems", "maxItems", "minLength", "minimum", "maximum", "title", "description",
+}
+_compiled_schemas = {}  # canonical JSON of a schema -> validator, shared across files
+
+
+def _is_type(value, name: str) -> bool:
+    if isinstance(value, bool) and name in ("integer", "number"):
+        return False
+    return isinstance(value, _TYPES[name])
+
+
+def compile_schema(schema: dict):
+    """
+    Compile a JSON Schema subset into validator(value, where="$") -> error or None.
+    Identical schemas are compiled once per process.
+    """
+    if not isinstance(schema, dict):
+        raise ApiCaseSpecError(f"schema must be an object, got {type(schema).__name__}")
+    key = json.dumps(schema, sort_keys=True)
+    if key in _compiled_schemas:
+        return _compiled_schemas[key]
+
+    unknown = set(schema) - _SCHEMA_KEYS
+    if unknown:
+        raise ApiCaseSpecError(f"unsupported schema keywords: {sorted(unknown)}")
+    checks = []
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if not set(types) <= set(_TYPES):
+            raise ApiCaseSpecError(f"unknown schema type(s): {sorted(set(types) - set(_TYPES))}")
+        checks.append(lambda v, w: None if any(_is_type(v, t) for t in types)
+                      else f"{w}: expected {'|'.join(types)}, got {type(v).__name__}")
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda v, w: None if v in allowed else f"{w}: {v!r} not in {allowed!r}")
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(lambda v, w: None if v == const else f"{w}: expected {const!r}, got {v!r}")
+    if "minimum" in schema:
+        low = schema["minimum"]
+        checks.append(lambda v, w: f"{w}: {v!r} < {low}" if _is_type(v, "number") and v < low else None)
+    if "maximum" in schema:
+        high = schema["maximum"]
+        checks.append(lambda v, w: f"{w}: {v!r} > {high}" if _is_type(v, "number") and v > high else None)
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        checks.append(lambda v, w: f"{w}: shorter than {min_length}"
+                      if isinstance(v, str) and len(v) < min_length else None)
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        checks.append(lambda v, w: f"{w}: {len(v)} items, expected at least {min_items}"
+                      if isinstance(v, list) and len(v) < min_items else None)
+    if "maxItems" in schema:
+        max_items = schema["maxItems"]
+        checks.append(lambda v, w: f"{w}: {len(v)} items, expected at most {max_items}"
+                      if isinstance(v, list) and len(v) > max_items else None)
+    if "required" in schema:
+        required = list(schema["required"])
+        checks.append(lambda v, w: None if not isinstance(v, dict) or all(k in v for k in required)
+                      else f"{w}: missing keys {[k for k in required if k not in v]}")
+    if "properties" in schema:
+        properties = {name: compile_schema(sub) for name, sub in schema["properties"].items()}
+
+        def check_properties(v, w):
+            if not isinstance(v, dict):
+                return None
+            for name, validate in properties.items():
+                if name in v:
+                    error = validate(v[name], f"{w}.{name}")
+                    if error:
+                        return error
+            return None
+        checks.append(check_properties)
+    if schema.get("additionalProperties") is False:
+        known = set(schema.get("properties", {}))
+        checks.append(lambda v, w: None if not isinstance(v, dict) or set(v) <= known
+                      else f"{w}: unexpected keys {sorted(set(v) - known)}")
+    if "items" in schema:
+        validate_item = compile_schema(schema["items"])
+
+        def check_items(v, w):
+            if not isinstance(v, list):
+                return None
+            for i, element in enumerate(v):
+                error = validate_item(element, f"{w}[{i}]")
+                if error:
+                    return error
+            return None
+        checks.append(check_items)
+
+    def validate(value, where: str = "$"):
+        for check in checks:
+            error = check(value, where)
+            if error:
+                return error
+        return None
+
+    _compiled_schemas[key] = validate
+    return validate
+
+
+def _subset_mismatch(expected, actual, where: str = "$"):
+    """First place `actual` differs from `expected` (dicts match on expected keys only)."""
+    if isinstance(expected, dict):
+        if not isinstance(actual, dict):
+            return f"{where}: expected an object, got {type(actual).__name__}"
+        for key, value in expected.items():
+            if key not in actual:
+                return f"{where}: missing key {key!r}"
+            error = _subset_mismatch(value, actual[key], f"{where}.{key}")
+            if error:
+                return error
+        return None
+    if isinstance(expected, list):
+        if not isinstance(actual, list) or len(actual) != len(expected):
+            return f"{where}: expected {expected!r}, got {actual!r}"
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            error = _subset_mismatch(e, a, f"{where}[{i}]")
+            if error:
+                return error
+        return None
+    return None if expected == actual else f"{where}: expected {expected!r}, got {actual!r}"
+
+
+# ---------------------------------------------------------------------------
+# Spec compiler
+# ---------------------------------------------------------------------------
+
+def load_spec(path) -> tuple:
+    """(rows, schemas, defaults) of a *.cases.json file."""
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    if isinstance(spec, list):
+        return spec, {}, {}
+    if isinstance(spec, dict) and isinstance(spec.get("test_cases"), list):
+        return spec["test_cases"], spec.get("schemas") or {}, spec.get("defaults") or {}
+    raise ApiCaseSpecError("expected a list of cases or an object with a 'test_cases' list")
+
+
+def compile_case(row: dict, schemas: dict, defaults: dict) -> dict:
+    """Validate and normalise one row; raises ApiCaseSpecError."""
+    if not isinstance(row, dict):
+        raise ApiCaseSpecError(f"case must be an object, got {type(row).__name__}")
+    case = {**defaults, **row}
+    unknown = set(case) - CASE_KEYS
+    if unknown:
+        raise ApiCaseSpecError(f"unknown keys {sorted(unknown)}")
+    for key in ("method", "path"):
+        if not case.get(key):
+            raise ApiCaseSpecError(f"missing '{key}'")
+    case["method"] = str(case["method"]).upper()
+    if case["method"] not in METHODS:
+        raise ApiCaseSpecError(f"unsupported method {case['method']}")
+    case.setdefault("expected_status", 200)
+    if not isinstance(case["expected_status"], (int, list)):
+        raise ApiCaseSpecError("'expected_status' must be an int or a list of ints")
+
+    schema = case.get("schema")
+    if isinstance(schema, str):
+        if schema not in schemas:
+            raise ApiCaseSpecError(f"unknown schema '{schema}'")
+        schema = schemas[schema]
+    case["validator"] = compile_schema(schema) if schema is not None else None
+    return case
+
+
+class ApiCaseFile(pytest.File):
+    """A *.cases.json file; yields one ApiCaseItem per row."""
+
+    def collect(self):
+        rows, schemas, defaults = load_spec(self.path)
+        seen = set()
+        for index, row in enumerate(rows):
+            test_id = row.get("test_id") if isinstance(row, dict) else None
+            test_id = test_id or f"case{index + 1}"
+            name = test_id
+            if isinstance(row, dict) and row.get("title"):
+                name = f"{test_id}_{slugify(row['title'])[:50]}"
+            if name in seen:
+                name = f"{name}_{index + 1}"
+            seen.add(name)
+            try:
+                case, error = compile_case(row, schemas, defaults), None
+            except ApiCaseSpecError as e:
+                case = row if isinstance(row, dict) else {}
+                error = f"{self.path.name} row {index + 1}: {e}"
+            yield ApiCaseItem.from_parent(self, name=name, case=case, spec_error=error)
+
+
+class ApiCaseItem(pytest.Item):
+    """One compiled API case: send (or collect the prefetched response) and check it."""
+
+    def __init__(self, *, case: dict, spec_error: str = None, **kwargs):
+        super().__init__(**kwargs)
+        self.case = case
+        self.spec_error = spec_error
+        concurrent_default = case.get("method") in CONCURRENT_METHODS
+        self.concurrent = bool(case.get("concurrent", concurrent_default)) and spec_error is None
+        self.future = None  # prefetched response, set by CaseRunner
+        self.request_seconds = None  # latency of this case's own request
+        self.add_marker("api")
+        for marker in case.get("markers") or []:
+            self.add_marker(marker)
+        if case.get("live"):
+            self.add_marker("live")
+
+    def send(self):
+        client = shared_client(self.config)
+        if self.get_closest_marker("live"):
+            client = client.live()
+        case = self.case
+        start = time.perf_counter()
+        try:
+            return client.request(
+                case["method"], case["path"],
+                params=case.get("params") or None,
+                json=case.get("body"),
+                headers=case.get("headers") or None,
+            )
+        finally:
+            self.request_seconds = time.perf_counter() - start
+
+    def runtest(self):
+        if self.spec_error:
+            raise ApiCaseSpecError(self.spec_error)
+        case = self.case
+        response = self.config._api_case_runner.response(self)
+        self.user_properties.append(("api_request_seconds", round(self.request_seconds, 6)))
+
+        expected = case["expected_status"]
+        expected = expected if isinstance(expected, list) else [expected]
+        if response.status_code not in expected:
+            raise ApiCaseFailure(
+                f"{case['method']} {case['path']}: expected status {expected}, got {response.status_code}"
+            )
+        if case.get("validator") is None and "expected_body" not in case:
+            return
+        try:
+            body = response.json()
+        except ValueError:
+            raise ApiCaseFailure(f"{case['method']} {case['path']}: response is not JSON")
+        error = case["validator"](body) if case.get("validator") else None
+        if error is None and "expected_body" in case:
+            error = _subset_mismatch(case["expected_body"], body)
+        if error:
+            raise ApiCaseFailure(f"{case['method']} {case['path']}: {error}")
+
+    def repr_failure(self, excinfo):
+        if isinstance(excinfo.value, (ApiCaseFailure, ApiCaseSpecError)):
+            return str(excinfo.value)
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self):
+        return self.path, None, f"{self.name}: {self.case.get('method', '?')} {self.case.get('path', '?')}"
+
+
+# ---------------------------------------------------------------------------
+# Shared client + concurrent runner
+# ---------------------------------------------------------------------------
+
+def shared_client(config) -> ApiClient:
+    """The session's pooled ApiClient - the same one the api_client fixture hands out."""
+    return session_client(config, API_BASE_URL, memoize=config.getoption("api_memo", False))
+
+
+class CaseRunner:
+    """Sends the requests of every selected case up front, on a bounded pool."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool = None
+        self._started = False
+
+    def _prefetch(self, session):
+        self._started = True
+        cases = [item for item in session.items if isinstance(item, ApiCaseItem) and item.concurrent]
+        if self.workers <= 1 or len(cases) <= 1:
+            return
+        shared_client(session.config)  # create it here, not racily in the workers
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="api-cases")
+        for item in cases:
+            item.future = self._pool.submit(item.send)
+
+    def response(self, item):
+        if not self._started:
+            self._prefetch(item.session)
+        future, item.future = item.future, None
+        return future.result() if future is not None else item.send()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def pytest_configure(config):
+    config._api_case_runner = CaseRunner(config.getoption("api_case_workers"))
+
+
+def pytest_collect_file(file_path, parent):
+    if file_path.name.endswith(CASE_FILE_SUFFIX):
+        return ApiCaseFile.from_parent(parent, path=file_path)
+
+
+def pytest_sessionfinish(session):
+    session.config._api_case_runner.close()
+    client = getattr(session.config, "_api_client", None)
+    if client is not None:
+        client.close()
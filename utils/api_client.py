@@ -0,0 +1,201 @@
+"""
+API Client - Pooled HTTP client for the REST API tests.
+
+1. Connection pooling: one requests.Session per client and thread (a Session
+   is not thread-safe), reused by every test
+2. Optional response memo for idempotent GET/HEAD requests:
+   - identical concurrent requests are coalesced into one network call (single-flight)
+   - later identical requests reuse a 2xx response and its parsed JSON
+   - a POST/PUT/PATCH/DELETE drops the memo of its path, the path's
+     sub-resources and its parent collection
+3. `live()` returns a view that always hits the wire (e.g. for latency checks)
+4. `session_client()` - one client per pytest session, shared by the `api_client`
+   fixture and the *.cases.json API cases (utils/api_cases.py)
+"""
+
+import json
+import threading
+from concurrent.futures import Future
+import requests
+
+
+MEMOIZABLE_METHODS = {"GET", "HEAD"}
+INVALIDATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class MemoizedResponse:
+    """
+    Read-only stand-in for a shared requests.Response.
+    json() is parsed once and the same object is returned to every caller,
+    so callers must treat it as read-only.
+    """
+
+    _UNPARSED = object()
+
+    def __init__(self, response: requests.Response):
+        self._response = response
+        self._json = self._UNPARSED
+        self._json_error = None
+
+    def json(self, **kwargs):
+        if self._json is self._UNPARSED and self._json_error is None:
+            try:
+                self._json = self._response.json(**kwargs)
+            except ValueError as e:
+                self._json_error = e
+        if self._json_error is not None:
+            raise self._json_error
+        return self._json
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+class ApiClient:
+    """Thin wrapper around requests.Session with an opt-in GET/HEAD memo."""
+
+    def __init__(self, base_url: str, memoize: bool = False, timeout: float = 30,
+                 session: requests.Session = None, _memo=None, _sessions=None):
+        self.base_url = base_url.rstrip("/")
+        self.memoize = memoize
+        self.timeout = timeout
+        # Shared between a client and its live() view. `generation` counts writes,
+        # so a GET that overlapped one is not memoized.
+        self._memo = _memo if _memo is not None else {
+            "lock": threading.Lock(), "done": {}, "inflight": {}, "generation": 0,
+        }
+        # A given session is used as-is; otherwise each thread gets its own pooled one
+        self._sessions = _sessions if _sessions is not None else {
+            "fixed": session, "local": threading.local(), "all": [], "lock": threading.Lock(),
+        }
+        self._calls_lock = threading.Lock()
+        self.network_calls = 0
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's pooled session."""
+        sessions = self._sessions
+        if sessions["fixed"] is not None:
+            return sessions["fixed"]
+        session = getattr(sessions["local"], "session", None)
+        if session is None:
+            session = sessions["local"].session = requests.Session()
+            with sessions["lock"]:
+                sessions["all"].append(session)
+        return session
+
+    def live(self) -> "ApiClient":
+        """Same pooled sessions, but every request goes to the network."""
+        return ApiClient(self.base_url, memoize=False, timeout=self.timeout,
+                         _memo=self._memo, _sessions=self._sessions)
+
+    def url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, **kwargs):
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        if method in INVALIDATING_METHODS:
+            try:
+                return self._send(method, path, **kwargs)
+            finally:
+                self._invalidate(path)
+        key = self._memo_key(method, path, kwargs)
+        if key is None:
+            return self._send(method, path, **kwargs)
+
+        memo = self._memo
+        with memo["lock"]:
+            if key in memo["done"]:
+                return memo["done"][key]
+            future = memo["inflight"].get(key)
+            leader = future is None
+            if leader:
+                future = memo["inflight"][key] = Future()
+                generation = memo["generation"]
+        if not leader:
+            return future.result()
+
+        try:
+            response = MemoizedResponse(self._send(method, path, **kwargs))
+        except Exception as e:
+            with memo["lock"]:
+                del memo["inflight"][key]
+            future.set_exception(e)
+            raise
+        with memo["lock"]:
+            # Errors (and 3xx/4xx/5xx) are only shared with the requests already waiting on them
+            if 200 <= response.status_code < 300 and memo["generation"] == generation:
+                memo["done"][key] = response
+            del memo["inflight"][key]
+        future.set_result(response)
+        return response
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        with self._calls_lock:
+            self.network_calls += 1
+        return self.session.request(method, self.url(path), **kwargs)
+
+    def _invalidate(self, path: str):
+        """Forget memoized responses a write to `path` may have changed."""
+        url = self.url(path).split("?", 1)[0].rstrip("/")
+        parent = url.rsplit("/", 1)[0]
+        memo = self._memo
+        with memo["lock"]:
+            memo["generation"] += 1
+            for key in list(memo["done"]):
+                cached = key[1].split("?", 1)[0].rstrip("/")
+                if cached in (url, parent) or cached.startswith(url + "/"):
+                    del memo["done"][key]
+
+    def _memo_key(self, method: str, path: str, kwargs: dict):
+        """Cache key for a memoizable request, or None if it must hit the wire."""
+        if not self.memoize or method not in MEMOIZABLE_METHODS:
+            return None
+        if any(kwargs.get(k) is not None for k in ("data", "json", "files", "auth", "stream")):
+            return None
+        params = kwargs.get("params") or {}
+        headers = kwargs.get("headers") or {}
+        return (
+            method,
+            self.url(path),
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+        )
+
+    def get(self, path: str, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def head(self, path: str, **kwargs):
+        return self.request("HEAD", path, **kwargs)
+
+    def post(self, path: str, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        sessions = self._sessions
+        if sessions["fixed"] is not None:
+            sessions["fixed"].close()
+        with sessions["lock"]:
+            for session in sessions["all"]:
+                session.close()
+            sessions["all"].clear()
+
+
+def session_client(config, base_url: str, memoize: bool = False) -> ApiClient:
+    """The session's pooled ApiClient, created on first use and stored on the pytest config."""
+    client = getattr(config, "_api_client", None)
+    if client is None:
+        client = config._api_client = ApiClient(base_url, memoize=memoize)
+    return client
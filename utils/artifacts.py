@@ -0,0 +1,171 @@
+"""
+Artifact Manager - pytest plugin that keeps Playwright traces/videos only for failures.
+
+1. Capture: pytest-playwright records traces (and video when RECORD_VIDEO is set)
+   in `retain-on-failure` mode, so passing tests discard theirs immediately.
+2. Collect: after a test's teardown, whatever pytest-playwright retained is moved
+   out of its transient output dir and zipped into reports/artifacts/<test>.zip
+   on a background thread, off the test thread.
+3. Quota: the archive dir is a ring buffer - once it exceeds the quota
+   (ARTIFACT_QUOTA_MB, default 500) the oldest archives are evicted first.
+   Confirmation reruns share the archive dir from their own processes, so each
+   process stages in a private dir and eviction tolerates concurrent deletes.
+
+The planned archive path of a failing test is known before its teardown, so
+the AI failure explainer can link it in its output.
+"""
+
+import os
+import re
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+
+BROWSER_FIXTURES = {"page", "context"}
+
+log = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("artifacts", "failure artifacts")
+    group.addoption(
+        "--artifacts-dir", default="reports/artifacts", metavar="DIR",
+        help="Where failure trace/video archives are kept (default: reports/artifacts)."
+    )
+    group.addoption(
+        "--artifacts-quota-mb", type=float, default=float(os.getenv("ARTIFACT_QUOTA_MB", "500")),
+        metavar="MB", help="Disk quota for the archive dir; oldest archives are evicted first."
+    )
+    group.addoption(
+        "--artifacts-suffix", default="", metavar="SUFFIX",
+        help="Suffix for archive names (used by confirmation reruns, e.g. -rerun1)."
+    )
+
+
+def artifact_slug(nodeid: str) -> str:
+    """Filesystem-safe, unique name for a test's archive."""
+    readable = re.sub(r"[^A-Za-z0-9_.-]+", "-", nodeid).strip("-")[-100:]
+    return f"{readable}-{hashlib.sha1(nodeid.encode('utf-8')).hexdigest()[:8]}"
+
+
+class ArtifactManager:
+    """Archives retained Playwright artifacts asynchronously under a disk quota."""
+
+    def __init__(self, source_dir: str, archive_dir: str, quota_bytes: int, suffix: str = ""):
+        self.source_dir = source_dir
+        self.archive_dir = archive_dir
+        self.quota_bytes = quota_bytes
+        self.suffix = suffix
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        os.makedirs(archive_dir, exist_ok=True)
+        # Private to this process: reruns archive into the same dir concurrently
+        self._staging = tempfile.mkdtemp(prefix=".staging-", dir=archive_dir)
+
+    def archive_path(self, nodeid: str) -> str:
+        return os.path.join(self.archive_dir, f"{artifact_slug(nodeid)}{self.suffix}.zip")
+
+    def collect(self, nodeid: str):
+        """
+        Move anything pytest-playwright retained for the just-finished test into
+        staging (a cheap rename) and zip it in the background.
+        """
+        if not os.path.isdir(self.source_dir):
+            return
+        folders = [os.path.join(self.source_dir, name) for name in os.listdir(self.source_dir)]
+        folders = [f for f in folders if os.path.isdir(f)]
+        if not folders:
+            return
+        staged = os.path.join(self._staging, f"{artifact_slug(nodeid)}{self.suffix}-{time.time_ns()}")
+        os.makedirs(staged)
+        for folder in folders:
+            shutil.move(folder, os.path.join(staged, os.path.basename(folder)))
+        self._pool.submit(self._archive, staged, self.archive_path(nodeid))
+
+    def _archive(self, staged: str, target: str):
+        tmp_target = f"{target}.{os.getpid()}.tmp"
+        try:
+            with zipfile.ZipFile(tmp_target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for root, _, files in os.walk(staged):
+                    for name in files:
+                        path = os.path.join(root, name)
+                        archive.write(path, os.path.relpath(path, staged))
+            os.replace(tmp_target, target)
+            self.enforce_quota()
+        except Exception:
+            log.exception("could not archive artifacts to %s", target)
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+        finally:
+            shutil.rmtree(staged, ignore_errors=True)
+
+    def enforce_quota(self):
+        """Delete the oldest archives until the archive dir fits in the quota."""
+        archives = []
+        for name in os.listdir(self.archive_dir):
+            if not name.endswith(".zip"):
+                continue
+            path = os.path.join(self.archive_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # evicted by another process meanwhile
+            archives.append((stat.st_mtime, stat.st_size, path))
+        archives.sort()
+        total = sum(size for _, size, _ in archives)
+        while len(archives) > 1 and total > self.quota_bytes:  # never evict the newest
+            _, size, oldest = archives.pop(0)
+            total -= size
+            try:
+                os.remove(oldest)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        """Wait for pending archives so none are lost at the end of the session."""
+        self._pool.shutdown(wait=True)
+        shutil.rmtree(self._staging, ignore_errors=True)  # only this process's staging dir
+
+
+def planned_artifacts(item) -> str:
+    """Archive path a failing browser test's artifacts will land in, or None."""
+    manager = getattr(item.config, "_artifact_manager", None)
+    if manager is None or not BROWSER_FIXTURES & set(getattr(item, "fixturenames", ())):
+        return None
+    return manager.archive_path(item.nodeid)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if not config.pluginmanager.hasplugin("playwright") or not hasattr(config.option, "tracing"):
+        return
+    # Cheap capture: keep traces (and video, if requested) only for failing tests
+    if config.option.tracing == "off":
+        config.option.tracing = "retain-on-failure"
+    if os.getenv("RECORD_VIDEO") and config.option.video == "off":
+        config.option.video = "retain-on-failure"
+    config._artifact_manager = ArtifactManager(
+        source_dir=config.getoption("output"),
+        archive_dir=config.getoption("artifacts_dir"),
+        quota_bytes=int(config.getoption("artifacts_quota_mb") * 1024 * 1024),
+        suffix=config.getoption("artifacts_suffix"),
+    )
+
+
+@pytest.hookimpl(hookwrapper=True, trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield  # fixture finalizers (incl. pytest-playwright's artifact recorder) have run
+    manager = getattr(item.config, "_artifact_manager", None)
+    if manager is not None:
+        manager.collect(item.nodeid)
+
+
+def pytest_sessionfinish(session):
+    manager = getattr(session.config, "_artifact_manager", None)
+    if manager is not None:
+        manager.close()
@@ -0,0 +1,97 @@
+"""
+Test Case Store - Keyed on-disk store for AI-generated test cases.
+
+One JSON file per module (ai_test_cases/<slug>_<hash>.json) holding the module
+description, its SHA-256 hash and the parsed test cases. Each module is
+written atomically as soon as it is generated, so an interrupted run keeps
+everything finished so far, and unchanged descriptions are never regenerated.
+"""
+
+import os
+import re
+import json
+import hashlib
+from datetime import datetime
+
+
+def description_hash(description: str) -> str:
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") or "module"
+
+
+def module_key(name: str) -> str:
+    """Readable, collision-free file stem: "Todo List" and "todo-list" share a slug, not a key."""
+    return f"{slugify(name)}_{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+
+
+class CaseStore:
+    """Directory of per-module JSON records, keyed by module name."""
+
+    def __init__(self, directory: str = "ai_test_cases", suffix: str = ".json"):
+        self.directory = directory
+        self.suffix = suffix
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, module: str) -> str:
+        return os.path.join(self.directory, f"{module_key(module)}{self.suffix}")
+
+    def get(self, module: str) -> dict:
+        """The stored record for `module`, or None."""
+        try:
+            with open(self._path(module), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_current(self, module: str, description: str) -> bool:
+        """True if `module` was already generated from this exact description."""
+        record = self.get(module)
+        return bool(record) and record.get("description_hash") == description_hash(description)
+
+    def put(self, module: str, description: str, test_cases: list):
+        """Persist one module's test cases (write to temp file, then rename)."""
+        record = {
+            "module": module,
+            "description": description,
+            "description_hash": description_hash(description),
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "test_cases": test_cases,
+        }
+        path = self._path(module)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def render_markdown(self, modules: list) -> str:
+        """Markdown for `modules` (dicts with 'name'/'description'), in the given order."""
+        output = [
+            f"# AI-Generated Test Cases",
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Generated using: GPT-4o-mini via OpenAI API",
+            f"Prompt strategy: Module description → structured JSON output\n",
+            "---\n"
+        ]
+        for module in modules:
+            record = self.get(module["name"])
+            test_cases = record.get("test_cases", []) if record else []
+
+            output.append(f"## {module['name']}")
+            output.append(f"**Module Description:** {module['description']}\n")
+
+            if test_cases:
+                for tc in test_cases:
+                    output.append(f"### {tc.get('test_id', 'TC')} - {tc.get('title', 'Untitled')}")
+                    output.append(f"**Category:** {tc.get('category', 'N/A')}")
+                    output.append(f"**Steps:**")
+                    for step in tc.get('steps', []):
+                        output.append(f"  - {step}")
+                    output.append(f"**Expected Result:** {tc.get('expected_result', 'N/A')}\n")
+            else:
+                output.append("*Could not generate test cases (LLM unavailable)*\n")
+
+            output.append("---\n")
+        return "\n".join(output)
@@ -0,0 +1,227 @@
+"""
+Failure Context - Token-budgeted failure context for the AI explainer prompt.
+
+Parses a pytest report's longrepr into pieces (assertion, Playwright call log,
+failing frame, test source, other frames), ranks them by how much they help
+explain the failure, and packs the best ones into a token budget. Frames from
+site-packages (pytest/playwright internals) rank last, so the budget goes to
+the lines that matter instead of arbitrary character slices.
+
+Tokens are counted with tiktoken when installed (offline, same BPE family as
+gpt-4o-mini), otherwise with a word/punctuation approximation.
+"""
+
+import os
+import re
+import inspect
+import linecache
+from dataclasses import dataclass, field
+
+
+DEFAULT_BUDGET = int(os.getenv("AI_CONTEXT_TOKENS", "400"))
+MIN_TRUNCATED_TOKENS = 24  # don't bother squeezing in a piece smaller than this
+
+# (kind, priority) - higher priority is packed first
+PRIORITY = {
+    "assertion": 100,
+    "failing_frame": 90,
+    "call_log": 80,
+    "test_source": 60,
+    "frame": 40,
+    "library_frame": 10,
+}
+# Order pieces appear in the prompt, regardless of packing order
+PROMPT_ORDER = ["assertion", "call_log", "failing_frame", "frame", "library_frame", "test_source"]
+
+_APPROX_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")
+except Exception:  # not installed, or encoding not cached offline
+    _encoding = None
+
+
+def count_tokens(text: str) -> int:
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(_APPROX_TOKEN.findall(text))
+
+
+@dataclass
+class ContextPiece:
+    kind: str
+    text: str
+    priority: int
+    tokens: int = 0
+
+    def __post_init__(self):
+        self.tokens = count_tokens(self.text)
+
+
+@dataclass
+class FailureContext:
+    error_message: str
+    stack_trace: str
+    tokens: int
+    dropped: list = field(default_factory=list)  # kinds that did not fit
+    location: str = ""  # failing frame as "path: source line" (see failure_location)
+
+
+def _is_library_path(path: str) -> bool:
+    return "site-packages" in path or f"{os.sep}lib{os.sep}python" in path or path.startswith("<")
+
+
+def _split_error_lines(lines: list) -> tuple:
+    """'E   ...' lines of a traceback entry -> (assertion lines, call log lines)."""
+    error = [line[1:].strip() for line in lines if line.startswith("E ")]
+    if "Call log:" in error:
+        at = error.index("Call log:")
+        return error[:at], error[at + 1:]
+    return error, []
+
+
+def _test_source(item, failing_line: int) -> str:
+    """Source of the test function, with the failing line marked '>'."""
+    func = getattr(item, "obj", None)
+    try:
+        lines, start = inspect.getsourcelines(func)
+    except (TypeError, OSError):
+        return ""
+    return "".join(
+        f"{'>' if start + i == failing_line else ' '} {line}" for i, line in enumerate(lines)
+    ).rstrip()
+
+
+def collect_pieces(longrepr, item=None) -> list:
+    """Break a report's longrepr into ranked ContextPieces."""
+    reprtraceback = getattr(longrepr, "reprtraceback", None)
+    entries = getattr(reprtraceback, "reprentries", None)
+    if not entries:
+        text = str(longrepr) if longrepr else "Unknown error"
+        return [ContextPiece("assertion", text, PRIORITY["assertion"])]
+
+    pieces = []
+    crash = getattr(longrepr, "reprcrash", None)
+    assertion, call_log = _split_error_lines(getattr(entries[-1], "lines", []))
+    if not assertion and crash is not None:
+        assertion = [crash.message]
+    pieces.append(ContextPiece("assertion", "\n".join(assertion), PRIORITY["assertion"]))
+    if call_log:
+        pieces.append(ContextPiece("call_log", "Call log:\n" + "\n".join(call_log), PRIORITY["call_log"]))
+
+    item_path = str(getattr(item, "path", "")) if item is not None else ""
+    failing_found = False
+    test_line = None
+    for depth, entry in enumerate(reversed(entries)):
+        loc = getattr(entry, "reprfileloc", None)
+        if loc is None:
+            continue
+        path = str(loc.path)
+        source = [line for line in getattr(entry, "lines", []) if not line.startswith("E ")]
+        text = f"{path}:{loc.lineno}\n" + "\n".join(source).rstrip()
+        if item_path and os.path.abspath(path) == item_path and test_line is None:
+            test_line = loc.lineno
+        if _is_library_path(os.path.abspath(path)):
+            pieces.append(ContextPiece("library_frame", text, PRIORITY["library_frame"] - depth))
+        elif not failing_found:
+            failing_found = True
+            pieces.append(ContextPiece("failing_frame", text, PRIORITY["failing_frame"]))
+        else:
+            pieces.append(ContextPiece("frame", text, PRIORITY["frame"] - depth))
+
+    if item is not None and test_line is not None:
+        source = _test_source(item, test_line)
+        if source:
+            pieces.append(ContextPiece("test_source", source, PRIORITY["test_source"]))
+    return pieces
+
+
+_DEF = re.compile(r"^(\s*)(?:async\s+)?def\s+(\w+)")
+
+
+def _enclosing_function(path: str, lineno: int) -> str:
+    """Name of the innermost def around line `lineno` of `path`, or ""."""
+    line = linecache.getline(path, lineno)
+    indent = len(line) - len(line.lstrip())
+    for number in range(lineno - 1, 0, -1):
+        match = _DEF.match(linecache.getline(path, number))
+        if match and len(match.group(1)) < indent:
+            return match.group(2)
+    return ""
+
+
+def failure_location(longrepr, item=None) -> str:
+    """
+    Where a failure happened, as "path::function: failing source line" of the
+    innermost non-library frame. Line numbers are left out so unrelated edits
+    above the line do not change it. Source is read from the file, so it does
+    not depend on --tb (short tracebacks carry no '>' marker). Falls back to
+    the test's nodeid without a traceback.
+    """
+    reprtraceback = getattr(longrepr, "reprtraceback", None)
+    for entry in reversed(getattr(reprtraceback, "reprentries", None) or []):
+        loc = getattr(entry, "reprfileloc", None)
+        if loc is None or _is_library_path(os.path.abspath(str(loc.path))):
+            continue
+        path = str(loc.path)
+        if os.path.isabs(path):
+            path = os.path.relpath(path)
+        source = linecache.getline(path, loc.lineno).strip()
+        if not source:  # source file gone: use the traceback's own copy of the line
+            lines = [line for line in getattr(entry, "lines", []) if not line.startswith("E ")]
+            marked = [line[1:] for line in lines if line.startswith(">")]
+            source = (marked or lines[-1:] or [""])[0].strip()
+        function = _enclosing_function(path, loc.lineno)
+        scope = f"{path.replace(os.sep, '/')}::{function}" if function else path.replace(os.sep, "/")
+        return f"{scope}: {source}"
+    return getattr(item, "nodeid", "") if item is not None else ""
+
+
+def _truncate(piece: ContextPiece, budget: int) -> ContextPiece:
+    """Keep as many leading lines of `piece` as fit in `budget` tokens."""
+    lines = piece.text.splitlines()
+    kept = []
+    for line in lines:
+        if count_tokens("\n".join(kept + [line, "..."])) > budget:
+            break
+        kept.append(line)
+    if not kept and lines:
+        # A single oversized line (e.g. a huge assertion diff): cut it down
+        line = lines[0]
+        while line and count_tokens(line + "...") > budget:
+            line = line[:int(len(line) * 0.8)]
+        kept = [line]
+    return ContextPiece(piece.kind, "\n".join(kept + ["..."]), piece.priority)
+
+
+def extract_failure_context(longrepr, item=None, budget: int = DEFAULT_BUDGET) -> FailureContext:
+    """
+    Pack the most relevant parts of a failure into `budget` tokens.
+
+    Returns FailureContext with `error_message` (assertion + call log) and
+    `stack_trace` (frames + test source), ready for explain_failure().
+    """
+    remaining = budget
+    packed, dropped = [], []
+    for piece in sorted(collect_pieces(longrepr, item), key=lambda p: -p.priority):
+        if piece.tokens <= remaining:
+            packed.append(piece)
+            remaining -= piece.tokens
+        elif remaining >= MIN_TRUNCATED_TOKENS:
+            piece = _truncate(piece, remaining)
+            packed.append(piece)
+            remaining -= piece.tokens
+        else:
+            dropped.append(piece.kind)
+
+    packed.sort(key=lambda p: (PROMPT_ORDER.index(p.kind), -p.priority))
+    error = [p.text for p in packed if p.kind in ("assertion", "call_log")]
+    trace = [p.text for p in packed if p.kind not in ("assertion", "call_log")]
+    return FailureContext(
+        error_message="\n".join(error) or "Unknown error",
+        stack_trace="\n\n".join(trace),
+        tokens=budget - remaining,
+        dropped=dropped,
+        location=failure_location(longrepr, item),
+    )
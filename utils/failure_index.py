@@ -0,0 +1,190 @@
+"""
+Failure Index - Offline similarity index over previously explained failures.
+
+Error text is normalized (quoted selectors, URLs, numbers, paths -> placeholders;
+numbers compared in assertions such as `404 == 200` are kept), shingled into word
+3-grams and reduced to a MinHash signature. Long errors are capped to a consistent
+sample of MAX_SHINGLES shingles, and the per-shingle permutations come from one
+blake2b digest, so signing costs the same for a 300-word Playwright call log as
+for a one-line assert. Signatures are bucketed with LSH banding, so a lookup
+touches only a handful of candidates; with tens of thousands of stored
+failures it costs on the order of a millisecond, against ~1 s for an LLM call.
+
+Entries are appended to a JSONL file together with their explanation. Only
+failures raised at the same location (failing frame path, function and source
+line - see failure_context.failure_location) are compared, so two unrelated
+`assert x == 3` in different tests never share an explanation. Reuse therefore
+covers repeats of one failing line whose details vary: e.g. a timeout in a
+shared page-object method on a different selector, or the same assert failing
+again in a later run. The same timeout raised from two different test lines is
+explained separately.
+"""
+
+import os
+import re
+import json
+import zlib
+import heapq
+import struct
+import hashlib
+
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+MAX_SHINGLES = 64  # longer errors are signed from a consistent sample of their shingles
+_EMPTY = 0xFFFF
+_HASH_KEY = b"testmu-failure-index-v2"  # fixed key: signatures must match across runs
+_UNPACK = struct.Struct(f"<{NUM_PERM}H").unpack
+
+_COMPARISON = r"(?:==|!=|<=|>=|<|>)"
+_NUMBER = r"-?\d+(?:\.\d+)?"
+_DIGITS_AS_LETTERS = str.maketrans("0123456789.-", "abcdefghijpm")
+# Every pattern starts with a literal/char class so the regex engine can skip ahead fast
+_NORMALIZERS = [
+    (re.compile(r"https?://\S+"), " url "),
+    (re.compile(r"\"[^\"\n]*\"|'[^'\n]*'"), " str "),
+    (re.compile(r"[\\/][\w.\-]+(?:[\\/][\w.\-]+)*\.\w+(?::\d+)?"), " path "),
+    (re.compile(r"0x[0-9a-fA-F]+"), " hex "),
+    # Compared values (expected vs. actual status, counts) tell failures apart: keep them
+    (re.compile(rf"([-\d]\d*(?:\.\d+)?)(?=\s*{_COMPARISON})"), lambda m: _keep_number(m.group(1))),
+    (re.compile(rf"({_COMPARISON})\s*({_NUMBER})"), lambda m: f"{m.group(1)} {_keep_number(m.group(2))}"),
+    (re.compile(r"\d+(?:\.\d+)?"), " num "),
+]
+_TOKEN = re.compile(r"[a-z_]+")
+
+
+def _keep_number(number: str) -> str:
+    """A number as a word token (digits spelled as letters) that survives the `num` placeholder."""
+    return f" v{number.translate(_DIGITS_AS_LETTERS)} "
+
+
+def normalize_error(text: str) -> str:
+    """Strip run-specific details so equivalent failures produce the same text."""
+    for pattern, replacement in _NORMALIZERS:
+        text = pattern.sub(replacement, text)
+    return " ".join(_TOKEN.findall(text.lower()))
+
+
+class _WordHashes(dict):
+    """Memo of word -> crc32; error vocabularies are small and highly repetitive."""
+
+    def __missing__(self, word):
+        if len(self) > 100_000:
+            self.clear()
+        value = self[word] = zlib.crc32(word.encode("utf-8"))
+        return value
+
+
+_WORD_HASHES = _WordHashes()
+
+
+def shingles(normalized: str) -> set:
+    """Word 3-grams of normalized text, hashed to stable 32-bit ints."""
+    words = list(map(_WORD_HASHES.__getitem__, normalized.split()))
+    if len(words) < 3:
+        return {hash(tuple(words)) & 0xFFFFFFFF} if words else set()
+    # Tuples of ints hash deterministically (no PYTHONHASHSEED), and this stays in C
+    return {h & 0xFFFFFFFF for h in map(hash, zip(words, words[1:], words[2:]))}
+
+
+def minhash(hashed_shingles: set) -> list:
+    """NUM_PERM 16-bit minimums; each shingle's NUM_PERM hash values come from one digest."""
+    if not hashed_shingles:
+        return [_EMPTY] * NUM_PERM
+    if len(hashed_shingles) > MAX_SHINGLES:
+        hashed_shingles = heapq.nsmallest(MAX_SHINGLES, hashed_shingles)
+    rows = [
+        _UNPACK(hashlib.blake2b(x.to_bytes(4, "little"), digest_size=2 * NUM_PERM, key=_HASH_KEY).digest())
+        for x in hashed_shingles
+    ]
+    return [min(column) for column in zip(*rows)]
+
+
+def _entry_key(location: str, normalized: str) -> str:
+    return hashlib.sha1(f"{location}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class FailureIndex:
+    """MinHash/LSH index of explained failures, persisted as JSONL."""
+
+    def __init__(self, path: str = "reports/failure_index.jsonl", threshold: float = 0.8):
+        self.path = path
+        self.threshold = threshold
+        self._entries = []
+        self._exact = {}    # sha1 of location + normalized text -> entry id
+        self._buckets = {}  # (location, band, band signature) -> [entry ids]
+        self._loaded = False
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._insert(json.loads(line))
+                    except (ValueError, KeyError):
+                        continue  # torn line from an interrupted run
+        except OSError:
+            pass
+
+    def _insert(self, entry: dict):
+        entry_id = len(self._entries)
+        self._entries.append(entry)
+        self._exact.setdefault(entry["key"], entry_id)
+        signature = entry["signature"]
+        location = entry.get("location", "")
+        for band in range(BANDS):
+            band_key = (location, band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+            self._buckets.setdefault(band_key, []).append(entry_id)
+
+    def __len__(self):
+        if not self._loaded:
+            self._load()
+        return len(self._entries)
+
+    def lookup(self, error_text: str, location: str = ""):
+        """
+        Most similar stored failure at `location` as (entry, similarity), or None
+        if nothing reaches the threshold. Similarity is the estimated Jaccard index.
+        """
+        if not self._loaded:
+            self._load()
+        normalized = normalize_error(error_text)
+        key = _entry_key(location, normalized)
+        if key in self._exact:
+            return self._entries[self._exact[key]], 1.0
+
+        signature = minhash(shingles(normalized))
+        candidates = set()
+        for band in range(BANDS):
+            band_key = (location, band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+            candidates.update(self._buckets.get(band_key, ()))
+        best, best_score = None, 0.0
+        for entry_id in candidates:
+            other = self._entries[entry_id]["signature"]
+            score = sum(1 for a, b in zip(signature, other) if a == b) / NUM_PERM
+            if score > best_score:
+                best, best_score = self._entries[entry_id], score
+        if best is None or best_score < self.threshold:
+            return None
+        return best, best_score
+
+    def add(self, test_name: str, error_text: str, explanation: str, classification: dict = None,
+            location: str = ""):
+        """Store an explained failure in memory and append it to the JSONL file."""
+        if not self._loaded:
+            self._load()
+        normalized = normalize_error(error_text)
+        entry = {
+            "test": test_name,
+            "location": location,
+            "key": _entry_key(location, normalized),
+            "signature": minhash(shingles(normalized)),
+            "explanation": explanation,
+            "classification": classification,
+        }
+        self._insert(entry)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
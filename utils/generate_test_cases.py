@@ -4,65 +4,103 @@ AI Test Case Generator Script
 Run this script to use LLM to generate test case ideas.
 Output is saved to AI_GENERATED_TEST_IDEAS.md
 
-Usage: python utils/generate_test_cases.py
+Modules are generated concurrently (bounded pool) with streamed responses.
+Each module's parsed JSON is saved to ai_test_cases/ as soon as it completes,
+modules whose description is unchanged are skipped, and the markdown is
+rendered from the store - so a failed or interrupted run loses nothing.
+
+With --api-cases DIR, modules marked "api": true also get executable API case
+specs saved as DIR/<module>_<hash>.cases.json, which pytest collects as tests.
+
+Usage: python utils/generate_test_cases.py [--modules modules.json] [--workers 4] [--force]
+                                           [--api-cases tests/api/cases]
 """
 
-from llm_helper import generate_test_cases
+import argparse
 import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from llm_helper import generate_test_cases, generate_api_cases
+from case_store import CaseStore
+
+
+DEFAULT_MODULES = [
+    {
+        "name": "Login Module",
+        "description": "A login page with username and password fields, submit button, "
+                       "and error messages. Supports session management and redirects on success."
+    },
+    {
+        "name": "Dashboard Module",
+        "description": "A task management dashboard where users can create, edit, complete, "
+                       "and delete tasks. Supports filtering by status (all/active/completed)."
+    },
+    {
+        "name": "REST API Module",
+        "description": "A REST API supporting CRUD operations on posts, users, comments, and todos. "
+                       "Returns JSON responses with standard HTTP status codes.",
+        "api": True
+    }
+]
+
+
+def generate_module(store: CaseStore, module: dict, generate=generate_test_cases) -> tuple:
+    """Generate + persist one module. Returns (test case count, streamed chunk count)."""
+    chunks = [0]
+
+    def on_token(_text):
+        chunks[0] += 1
+
+    test_cases = generate(module["name"], module["description"], on_token=on_token)
+    if test_cases:
+        store.put(module["name"], module["description"], test_cases)
+    return len(test_cases), chunks[0]
 
 
 def main():
-    modules = [
-        {
-            "name": "Login Module",
-            "description": "A login page with username and password fields, submit button, "
-                           "and error messages. Supports session management and redirects on success."
-        },
-        {
-            "name": "Dashboard Module",
-            "description": "A task management dashboard where users can create, edit, complete, "
-                           "and delete tasks. Supports filtering by status (all/active/completed)."
-        },
-        {
-            "name": "REST API Module",
-            "description": "A REST API supporting CRUD operations on posts, users, comments, and todos. "
-                           "Returns JSON responses with standard HTTP status codes."
-        }
-    ]
-    
-    output = [
-        f"# AI-Generated Test Cases",
-        f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"Generated using: GPT-4o-mini via OpenAI API",
-        f"Prompt strategy: Module description → structured JSON output\n",
-        "---\n"
-    ]
-    
-    for module in modules:
-        print(f"Generating test cases for: {module['name']}...")
-        test_cases = generate_test_cases(module["name"], module["description"])
-        
-        output.append(f"## {module['name']}")
-        output.append(f"**Module Description:** {module['description']}\n")
-        
-        if test_cases:
-            for tc in test_cases:
-                output.append(f"### {tc.get('test_id', 'TC')} - {tc.get('title', 'Untitled')}")
-                output.append(f"**Category:** {tc.get('category', 'N/A')}")
-                output.append(f"**Steps:**")
-                for step in tc.get('steps', []):
-                    output.append(f"  - {step}")
-                output.append(f"**Expected Result:** {tc.get('expected_result', 'N/A')}\n")
-        else:
-            output.append("*Could not generate test cases (LLM unavailable)*\n")
-        
-        output.append("---\n")
-    
-    with open("AI_GENERATED_TEST_IDEAS.md", "w") as f:
-        f.write("\n".join(output))
-    
-    print("\n✅ Test cases saved to AI_GENERATED_TEST_IDEAS.md")
+    parser = argparse.ArgumentParser(description="Generate AI test case ideas per module.")
+    parser.add_argument("--modules", help="JSON file with a list of {\"name\", \"description\"} objects")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM requests (default: 4)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the description is unchanged")
+    parser.add_argument("--store", default="ai_test_cases", help="Directory for per-module JSON results")
+    parser.add_argument("--output", default="AI_GENERATED_TEST_IDEAS.md", help="Markdown output file")
+    parser.add_argument("--api-cases", metavar="DIR",
+                        help="Also write executable API case specs for \"api\" modules to DIR/<module>_<hash>.cases.json")
+    args = parser.parse_args()
+
+    modules = DEFAULT_MODULES
+    if args.modules:
+        with open(args.modules, encoding="utf-8") as f:
+            modules = json.load(f)
+
+    store = CaseStore(args.store)
+    jobs = [(store, m, generate_test_cases) for m in modules]
+    if args.api_cases:
+        api_store = CaseStore(args.api_cases, suffix=".cases.json")
+        jobs += [(api_store, m, generate_api_cases) for m in modules if m.get("api")]
+    pending = [job for job in jobs if args.force or not job[0].is_current(job[1]["name"], job[1]["description"])]
+    print(f"{len(jobs) - len(pending)} job(s) unchanged, generating {len(pending)}...")
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(generate_module, *job): job for job in pending}
+        for future in as_completed(futures):
+            job_store, module, _ = futures[future]
+            name = module["name"] if job_store is store else f"{module['name']} (API cases)"
+            try:
+                count, chunks = future.result()
+            except Exception as e:
+                count, chunks = 0, 0
+                print(f"[LLM] {name} failed: {e}")
+            if count:
+                print(f"  ✅ {name}: {count} test cases ({chunks} chunks streamed)")
+            else:
+                failed += 1
+                print(f"  ❌ {name}: no test cases - will retry on next run")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(store.render_markdown(modules))
+
+    print(f"\n✅ Test cases saved to {args.output} ({failed} job(s) failed)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,410 @@
+"""
+Test Impact Selection - pytest plugin that runs only the tests a change can affect.
+
+1. Dependency map: at collection time every test is mapped to what it depends on -
+   its test file, the fixtures it uses, the helper modules/classes/functions it
+   references (followed transitively), the conftest hooks (which pull in the
+   utils/llm_helper functions used by the AI hook) and the origins it targets.
+2. Change set: `git diff <base>` is mapped down to changed top-level symbols
+   (functions/classes) per file, so editing generate_test_cases() in llm_helper
+   does not select every test just because the hook imports explain_failure().
+3. Selection: tests whose dependencies intersect the change set are kept, the
+   rest are deselected. If the map cannot account for a change (stale map, git
+   failure, global config edit) the full suite runs instead.
+
+Usage:
+    pytest --impact-base=origin/main                 # tests affected by the diff
+    pytest --impact-origin=https://demo.playwright.dev   # tests hitting an origin
+"""
+
+import os
+import ast
+import sys
+import json
+import inspect
+import subprocess
+from urllib.parse import urlsplit
+
+
+MODULE_SCOPE = "<module>"
+ALL_SYMBOLS = "*"
+
+# Edits to these always run the whole suite
+GLOBAL_FILES = {"pytest.ini", "requirements.txt", "setup.cfg", "pyproject.toml", "tox.ini"}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "test impact selection")
+    group.addoption(
+        "--impact-base", default=None, metavar="REF",
+        help="Only run tests affected by `git diff REF` (e.g. origin/main)."
+    )
+    group.addoption(
+        "--impact-origin", action="append", default=[], metavar="ORIGIN",
+        help="Only run tests that target ORIGIN (e.g. https://demo.playwright.dev). Repeatable."
+    )
+    group.addoption(
+        "--impact-map", default="reports/impact_map.json", metavar="PATH",
+        help="Where to write the test dependency map (default: reports/impact_map.json)."
+    )
+
+
+class SymbolGraph:
+    """Resolves top-level symbols of repo modules to the repo symbols they depend on."""
+
+    def __init__(self, rootdir: str):
+        self.rootdir = os.path.abspath(rootdir)
+        self._ast_cache = {}
+        self._deps_cache = {}
+
+    def relpath(self, path) -> str:
+        """Repo-relative posix path, or None if `path` is outside the repo."""
+        if not path:
+            return None
+        path = os.path.abspath(str(path))
+        if not path.startswith(self.rootdir + os.sep):
+            return None
+        if f"{os.sep}site-packages{os.sep}" in path:
+            return None
+        return os.path.relpath(path, self.rootdir).replace(os.sep, "/")
+
+    def _top_level_nodes(self, path: str) -> dict:
+        """Top-level def/class name -> AST node (parsed once per file)."""
+        if path not in self._ast_cache:
+            nodes = {}
+            try:
+                with open(path, encoding="utf-8") as f:
+                    tree = ast.parse(f.read())
+            except (OSError, SyntaxError, ValueError):
+                tree = None
+            for node in tree.body if tree else []:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    nodes[node.name] = node
+            self._ast_cache[path] = nodes
+        return self._ast_cache[path]
+
+    def module_symbols(self, path: str) -> dict:
+        """Top-level def/class name -> (first_line, last_line, referenced names)."""
+        return {
+            name: (
+                min([node.lineno] + [d.lineno for d in node.decorator_list]),
+                node.end_lineno,
+                _referenced_names(node),
+            )
+            for name, node in self._top_level_nodes(path).items()
+        }
+
+    def symbol_origins(self, path: str, name: str) -> set:
+        """URL origins hard-coded inside a top-level def (e.g. a base_url fixture default)."""
+        node = self._top_level_nodes(path).get(name)
+        if node is None:
+            return set()
+        return {
+            _origin(child.value) for child in ast.walk(node)
+            if isinstance(child, ast.Constant) and _is_url(child.value)
+        }
+
+    def module_references(self, module) -> set:
+        """Every name referenced anywhere in a module's source."""
+        try:
+            with open(module.__file__, encoding="utf-8") as f:
+                return _referenced_names(ast.parse(f.read()))
+        except (OSError, SyntaxError, ValueError, TypeError, AttributeError):
+            return set()
+
+    def resolve(self, module, name: str) -> set:
+        """Dependency keys for `name` as seen from `module`'s globals."""
+        value = getattr(module, name, None)
+        if value is None:
+            return set()
+        if inspect.ismodule(value):
+            rel = self.relpath(getattr(value, "__file__", None))
+            return {rel} if rel else set()
+        if not (inspect.isfunction(value) or inspect.isclass(value)):
+            return set()  # constants are part of their module's scope
+        try:
+            source = inspect.getsourcefile(value)
+        except TypeError:
+            return set()
+        home = sys.modules.get(value.__module__)
+        if home is None or self.relpath(source) is None:
+            return set()
+        return self.symbol_deps(home, value.__name__)
+
+    def symbol_deps(self, module, name: str) -> set:
+        """Dependency keys for top-level symbol `name` defined in `module`, transitively."""
+        rel = self.relpath(getattr(module, "__file__", None))
+        if rel is None:
+            return set()
+        key = f"{rel}::{name}"
+        if key in self._deps_cache:
+            return self._deps_cache[key]
+        deps = {key, f"{rel}::{MODULE_SCOPE}"}
+        self._deps_cache[key] = deps  # break cycles
+        symbols = self.module_symbols(module.__file__)
+        if name in symbols:
+            for ref in symbols[name][2]:
+                if ref in symbols:
+                    deps |= self.symbol_deps(module, ref)
+                elif ref != name:
+                    deps |= self.resolve(module, ref)
+        return deps
+
+    def module_deps(self, module) -> set:
+        """Dependency keys for a whole module (every name it references)."""
+        rel = self.relpath(getattr(module, "__file__", None))
+        if rel is None:
+            return set()
+        deps = {rel}
+        for ref in self.module_references(module):
+            deps |= self.resolve(module, ref)
+        return deps
+
+
+def _referenced_names(node) -> set:
+    """Names loaded inside an AST node (roots of attribute chains included)."""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+    return names
+
+
+def _is_url(value) -> bool:
+    return isinstance(value, str) and value.startswith(("http://", "https://"))
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _origins_of(module, graph: SymbolGraph) -> set:
+    """URL origins a module targets: string constants and page-object URL attributes."""
+    origins = set()
+    for ref in graph.module_references(module):
+        value = getattr(module, ref, None)
+        candidates = [value, getattr(value, "URL", None)] if inspect.isclass(value) else [value]
+        origins |= {_origin(c) for c in candidates if _is_url(c)}
+    return origins
+
+
+def build_dependency_map(session, items) -> dict:
+    """nodeid -> {'deps': [...], 'origins': [...]} for every collected item."""
+    graph = SymbolGraph(str(session.config.rootpath))
+    conftests = [
+        p for p in session.config.pluginmanager.get_plugins()
+        if inspect.ismodule(p) and os.path.basename(getattr(p, "__file__", "") or "") == "conftest.py"
+    ]
+    fixture_names = {}  # conftest path -> names of fixtures defined there
+    for defs in session._fixturemanager._arg2fixturedefs.values():
+        for fixturedef in defs:
+            path = _source_of(fixturedef.func)
+            if path:
+                fixture_names.setdefault(path, set()).add(fixturedef.func.__name__)
+
+    # Hooks, helpers and module code in a conftest apply to every test below it
+    conftest_deps = {}
+    for conftest in conftests:
+        deps = {f"{graph.relpath(conftest.__file__)}::{MODULE_SCOPE}"}
+        own_fixtures = fixture_names.get(os.path.abspath(conftest.__file__), set())
+        for name in graph.module_symbols(conftest.__file__):
+            if name not in own_fixtures:
+                deps |= graph.symbol_deps(conftest, name)
+        conftest_deps[os.path.dirname(os.path.abspath(conftest.__file__))] = deps
+
+    module_cache = {}
+    mapping = {}
+    for item in items:
+        deps = set()
+        origins = set()
+        rel = graph.relpath(item.path)
+        if rel:
+            deps.add(rel)
+        module = getattr(item, "module", None)
+        if module is not None:
+            if module.__name__ not in module_cache:
+                module_cache[module.__name__] = (graph.module_deps(module), _origins_of(module, graph))
+            module_deps, module_origins = module_cache[module.__name__]
+            deps |= module_deps
+            origins |= module_origins
+        else:
+            # Non-python items (e.g. data-driven cases) depend on their item class
+            # and target whatever origins their plugin module hard-codes
+            item_module = sys.modules.get(type(item).__module__)
+            deps |= graph.resolve(item_module, type(item).__name__)
+            if item_module is not None:
+                origins |= _origins_of(item_module, graph)
+        item_dir = os.path.abspath(str(item.path.parent))
+        for conftest_dir, shared in conftest_deps.items():
+            if item_dir == conftest_dir or item_dir.startswith(conftest_dir + os.sep):
+                deps |= shared
+        fixtureinfo = getattr(item, "_fixtureinfo", None)
+        for defs in (fixtureinfo.name2fixturedefs.values() if fixtureinfo else []):
+            for fixturedef in defs:
+                home = sys.modules.get(getattr(fixturedef.func, "__module__", ""))
+                if home is not None and graph.relpath(getattr(home, "__file__", None)):
+                    deps |= graph.symbol_deps(home, fixturedef.func.__name__)
+                    origins |= graph.symbol_origins(home.__file__, fixturedef.func.__name__)
+        mapping[item.nodeid] = {"deps": sorted(deps), "origins": sorted(origins)}
+    return mapping
+
+
+def _source_of(func) -> str:
+    try:
+        path = inspect.getsourcefile(func)
+    except TypeError:
+        return None
+    return os.path.abspath(path) if path else None
+
+
+def git_changed_symbols(rootdir: str, base: str) -> dict:
+    """
+    Maps `git diff base` to {relative_path: set of changed symbols}.
+    ALL_SYMBOLS means the whole file changed (new, deleted or non-python).
+    Raises RuntimeError if git cannot produce the diff.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--no-renames", "--unified=0", base, "--"],
+            cwd=rootdir, capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"git diff failed: {e}")
+    if result.returncode != 0:
+        raise RuntimeError(f"git diff failed: {result.stderr.strip()}")
+
+    changed_lines = {}
+    old_path = new_path = None
+    for line in result.stdout.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line[4:] == "/dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            new_path = None if line[4:] == "/dev/null" else line[6:]
+            if old_path and not new_path:
+                changed_lines[old_path] = None  # deleted
+            elif new_path and not old_path:
+                changed_lines[new_path] = None  # added
+            else:
+                changed_lines.setdefault(new_path, set())
+        elif line.startswith("@@") and new_path and changed_lines.get(new_path) is not None:
+            # @@ -a,b +c,d @@  -> lines c..c+d-1 changed (d == 0: deletion after line c)
+            new_range = line.split()[2][1:]
+            start, _, count = new_range.partition(",")
+            start, count = int(start), int(count or 1)
+            lines = range(start, start + count) if count else (start, start + 1)
+            changed_lines[new_path].update(lines)
+
+    changes = {}
+    for path, lines in changed_lines.items():
+        full_path = os.path.join(rootdir, path)
+        if lines is None or not path.endswith(".py") or not os.path.exists(full_path):
+            changes[path] = {ALL_SYMBOLS}
+            continue
+        symbols = SymbolGraph(rootdir).module_symbols(full_path)
+        touched = set()
+        for lineno in lines:
+            owner = next(
+                (name for name, (first, last, _) in symbols.items() if first <= lineno <= last),
+                MODULE_SCOPE
+            )
+            touched.add(owner)
+        changes[path] = touched
+    return changes
+
+
+def is_affected(deps, changes: dict) -> bool:
+    """True if any dependency key is touched by the change set."""
+    for dep in deps:
+        path, _, symbol = dep.partition("::")
+        touched = changes.get(path)
+        if not touched:
+            continue
+        if not symbol or ALL_SYMBOLS in touched or MODULE_SCOPE in touched or symbol in touched:
+            return True
+    return False
+
+
+def unmapped_changes(changes: dict, mapping: dict, rootdir: str, testpaths) -> list:
+    """Changed files the map cannot account for - any of these forces a full run."""
+    mapped = {dep.partition("::")[0] for entry in mapping.values() for dep in entry["deps"]}
+    loaded = set()
+    graph = SymbolGraph(rootdir)
+    for module in list(sys.modules.values()):
+        rel = graph.relpath(getattr(module, "__file__", None))
+        if rel:
+            loaded.add(rel)
+    unmapped = []
+    for path in changes:
+        if path in mapped:
+            continue
+        if os.path.basename(path) in GLOBAL_FILES or os.path.basename(path) == "conftest.py":
+            unmapped.append(path)
+        elif path in loaded:
+            unmapped.append(path)  # imported by the run but reached by no test
+        elif any(path.startswith(tp.rstrip("/") + "/") for tp in testpaths):
+            unmapped.append(path)  # test data we cannot attribute
+    return unmapped
+
+
+def pytest_collection_modifyitems(session, config, items):
+    base = config.getoption("impact_base")
+    wanted_origins = {o.rstrip("/") for o in config.getoption("impact_origin")}
+    if not base and not wanted_origins:
+        return
+
+    rootdir = str(config.rootpath)
+    mapping = build_dependency_map(session, items)
+    _write_map(config.getoption("impact_map"), rootdir, mapping)
+
+    keep = {item.nodeid for item in items}
+    summary = []
+    if base:
+        try:
+            changes = git_changed_symbols(rootdir, base)
+        except RuntimeError as e:
+            changes = None
+            summary.append(f"impact: {e} - running full suite")
+        if changes is not None:
+            unmapped = unmapped_changes(changes, mapping, rootdir, config.getini("testpaths"))
+            if unmapped:
+                summary.append(f"impact: map does not cover {', '.join(sorted(unmapped))} - running full suite")
+            else:
+                keep = {nodeid for nodeid in keep if is_affected(mapping[nodeid]["deps"], changes)}
+                summary.append(f"impact: {len(changes)} changed file(s) vs {base}")
+    if wanted_origins:
+        keep = {nodeid for nodeid in keep if wanted_origins & set(mapping[nodeid]["origins"])}
+        summary.append(f"impact: filtering to origin(s) {', '.join(sorted(wanted_origins))}")
+
+    selected = [item for item in items if item.nodeid in keep]
+    deselected = [item for item in items if item.nodeid not in keep]
+    summary.append(f"impact: selected {len(selected)}, deselected {len(deselected)}")
+    config._impact_summary = summary
+    config._impact_deselected_all = bool(items) and not selected
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_report_collectionfinish(config):
+    return getattr(config, "_impact_summary", [])
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Nothing affected is a success, not "no tests collected"
+    if exitstatus == 5 and getattr(session.config, "_impact_deselected_all", False):
+        session.exitstatus = 0
+
+
+def _write_map(path: str, rootdir: str, mapping: dict):
+    if not path:
+        return
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=rootdir, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.TimeoutExpired):
+        head = ""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"head": head, "tests": mapping}, f, indent=2)
@@ -3,10 +3,12 @@ LLM Helper - Core AI utility for:
 1. Failure Explainer: Explains test failures in plain English
 2. Flaky Test Classifier: Classifies if a failure is flaky or real
 3. Test Case Generator: Generates test ideas using LLM
+4. API Case Generator: Generates executable API case specs (see utils/api_cases.py)
 """
 
 import os
 import json
+import time
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -14,17 +16,57 @@ load_dotenv()
 
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY", "sk-placeholder"))
 
+# Callbacks notified after every LLM call: listener(purpose, seconds, usage_or_None).
+# Empty unless instrumentation is enabled (see utils/metrics.py).
+llm_call_listeners = []
+
+
+def _notify(purpose: str, started: float, usage):
+    seconds = time.perf_counter() - started
+    for listener in llm_call_listeners:
+        listener(purpose, seconds, usage)
+
+
+def _chat_completion(purpose: str, **kwargs):
+    """client.chat.completions.create(), timed and reported to llm_call_listeners."""
+    if not llm_call_listeners:
+        return client.chat.completions.create(**kwargs)
+    started = time.perf_counter()
+    if not kwargs.get("stream"):
+        try:
+            response = client.chat.completions.create(**kwargs)
+        except Exception:
+            _notify(purpose, started, None)
+            raise
+        _notify(purpose, started, getattr(response, "usage", None))
+        return response
+    kwargs.setdefault("stream_options", {"include_usage": True})
+    return _timed_stream(purpose, started, client.chat.completions.create(**kwargs))
+
+
+def _timed_stream(purpose: str, started: float, stream):
+    """Yield stream chunks; report latency + usage once the stream is consumed."""
+    usage = None
+    try:
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            yield chunk
+    finally:
+        _notify(purpose, started, usage)
+
 
 def explain_failure(test_name: str, error_message: str, stack_trace: str = "") -> str:
     """
     Takes a test failure and returns a plain-English explanation + fix suggestion.
-    This is called automatically when any test fails (via conftest.py hook).
+    This is called automatically when any test fails (via conftest.py hook),
+    which already packs error_message/stack_trace into a token budget
+    (utils/failure_context.py).
     """
     prompt = f"""You are an expert QA engineer. A Playwright test has failed.
 
 Test Name: {test_name}
 Error Message: {error_message}
-Stack Trace: {stack_trace[:1000] if stack_trace else 'Not available'}
+Stack Trace: {stack_trace if stack_trace else 'Not available'}
 
 Please provide:
 1. A plain-English explanation of what went wrong (2-3 sentences)
@@ -37,7 +79,8 @@ ROOT CAUSE: ...
 FIX: ...
 """
     try:
-        response = client.chat.completions.create(
+        response = _chat_completion(
+            "explain_failure",
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=300,
@@ -81,7 +124,8 @@ Respond ONLY with valid JSON:
 }}"""
     
     try:
-        response = client.chat.completions.create(
+        response = _chat_completion(
+            "classify_flaky_test",
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=150,
@@ -100,10 +144,14 @@ Respond ONLY with valid JSON:
         }
 
 
-def generate_test_cases(module: str, description: str) -> list:
+def generate_test_cases(module: str, description: str, on_token=None) -> list:
     """
     Uses LLM to generate test case ideas for a given module.
     Used during test planning — output is logged in AI_USAGE_LOG.md
+
+    Args:
+        on_token: Optional callback; when given, the response is streamed and
+                  each text chunk is passed to it as it arrives.
     """
     prompt = f"""You are a senior QA engineer. Generate comprehensive test cases for:
 
@@ -124,18 +172,78 @@ Respond ONLY with valid JSON array:
 ]"""
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=2000,
-            temperature=0.4
-        )
-        content = response.choices[0].message.content.strip()
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        return json.loads(content)
+        return _generate_json("generate_test_cases", prompt, on_token)
+    except Exception as e:
+        print(f"[LLM] Could not generate test cases for {module}: {e}")
+        return []
+
+
+def generate_api_cases(module: str, description: str, on_token=None) -> list:
+    """
+    Uses LLM to generate executable API case specs (rows for a *.cases.json file,
+    compiled into pytest items by utils/api_cases.py).
+
+    Args:
+        on_token: Optional callback; when given, the response is streamed and
+                  each text chunk is passed to it as it arrives.
+    """
+    prompt = f"""You are a senior QA engineer. Generate executable REST API test cases for:
+
+Module: {module}
+Description: {description}
+
+Generate 8-10 cases covering: happy path, edge cases, negative tests.
+Paths are relative to the API base URL. "schema" uses only these JSON Schema
+keywords: type, required, properties, items, enum, const, minimum, maximum,
+minLength, minItems, maxItems, additionalProperties.
+
+Respond ONLY with valid JSON array:
+[
+  {{
+    "test_id": "TC301",
+    "title": "...",
+    "category": "positive|negative|edge",
+    "method": "GET|POST|PUT|PATCH|DELETE",
+    "path": "/resource/1",
+    "params": {{}},
+    "body": null,
+    "expected_status": 200,
+    "schema": {{"type": "object", "required": ["id"]}},
+    "expected_body": {{"id": 1}}
+  }}
+]"""
+
+    try:
+        return _generate_json("generate_api_cases", prompt, on_token, max_tokens=3000, temperature=0.2)
     except Exception as e:
-        print(f"[LLM] Could not generate test cases: {e}")
+        print(f"[LLM] Could not generate API cases for {module}: {e}")
         return []
+
+
+def _generate_json(purpose: str, prompt: str, on_token=None, max_tokens: int = 2000,
+                   temperature: float = 0.4):
+    """Run a prompt that answers with JSON (optionally streamed) and parse the answer."""
+    response = _chat_completion(
+        purpose,
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=on_token is not None
+    )
+    if on_token is None:
+        content = response.choices[0].message.content
+    else:
+        chunks = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                chunks.append(delta)
+                on_token(delta)
+        content = "".join(chunks)
+    content = content.strip()
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return json.loads(content)
@@ -0,0 +1,221 @@
+"""
+Suite Metrics - pytest plugin that shows where suite time goes.
+
+Records high-resolution timings for every test phase (setup/call/teardown plus
+the report hook, where the AI explainer runs), every fixture setup, every
+page-object action, and every LLM call (latency + tokens). At session end it
+writes:
+    <dir>/metrics.prom        OpenMetrics text for dashboards
+    <dir>/flamegraph.folded   collapsed stacks (flamegraph.pl / speedscope)
+
+When --metrics-dir is not given the plugin registers nothing, so a normal
+run pays no overhead.
+
+Usage:
+    pytest --metrics-dir=reports/metrics
+"""
+
+import os
+import time
+import pytest
+from utils import llm_helper
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("metrics", "suite performance metrics")
+    group.addoption(
+        "--metrics-dir", default=os.getenv("METRICS_DIR"), metavar="DIR",
+        help="Write OpenMetrics + collapsed-stack timings for this run to DIR."
+    )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _frame(text) -> str:
+    """Collapsed-stack frames are ';'-separated, one stack per line."""
+    return str(text).replace(";", ":").replace(" ", "_").replace("\n", "_")
+
+
+class MetricsRecorder:
+    """Collects per-test timings in memory and renders them at session end."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.started = time.perf_counter_ns()
+        self.current = None      # nodeid of the running test
+        self.phases = {}         # nodeid -> {phase: ns}
+        self.fixtures = {}       # nodeid -> [(fixture, scope, ns)]
+        self.page_actions = {}   # nodeid -> {action: seconds}
+        self.llm_calls = []      # (nodeid or None, purpose, seconds, prompt_tokens, completion_tokens)
+
+    # -- collection -----------------------------------------------------
+
+    def _add_phase(self, nodeid: str, phase: str, ns: int):
+        phases = self.phases.setdefault(nodeid, {})
+        phases[phase] = phases.get(phase, 0) + ns
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.current = item.nodeid
+        yield
+        self.current = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        start = time.perf_counter_ns()
+        yield
+        self._add_phase(item.nodeid, "setup", time.perf_counter_ns() - start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        start = time.perf_counter_ns()
+        yield
+        self._add_phase(item.nodeid, "call", time.perf_counter_ns() - start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        start = time.perf_counter_ns()
+        yield
+        self._add_phase(item.nodeid, "teardown", time.perf_counter_ns() - start)
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        # Outermost wrapper: includes the AI explainer and rerun confirmation
+        start = time.perf_counter_ns()
+        yield
+        self._add_phase(item.nodeid, "report", time.perf_counter_ns() - start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter_ns()
+        yield
+        if self.current is not None:
+            self.fixtures.setdefault(self.current, []).append(
+                (fixturedef.argname, fixturedef.scope, time.perf_counter_ns() - start)
+            )
+
+    def pytest_runtest_logreport(self, report):
+        for name, value in report.user_properties:
+            if name == "page_timings" and isinstance(value, dict):
+                self.page_actions[report.nodeid] = value
+
+    def on_llm_call(self, purpose: str, seconds: float, usage):
+        self.llm_calls.append((
+            self.current, purpose, seconds,
+            getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None),
+        ))
+
+    # -- output ---------------------------------------------------------
+
+    def openmetrics(self) -> str:
+        lines = [
+            "# TYPE testmu_session_duration_seconds gauge",
+            "# HELP testmu_session_duration_seconds Wall time of the whole pytest session.",
+            f"testmu_session_duration_seconds {(time.perf_counter_ns() - self.started) / 1e9:.6f}",
+            "# TYPE testmu_test_phase_seconds gauge",
+            "# HELP testmu_test_phase_seconds Time spent per test phase (report = AI hook).",
+        ]
+        for nodeid, phases in self.phases.items():
+            for phase, ns in phases.items():
+                lines.append(f"testmu_test_phase_seconds{_labels(test=nodeid, phase=phase)} {ns / 1e9:.6f}")
+
+        lines += [
+            "# TYPE testmu_fixture_setup_seconds gauge",
+            "# HELP testmu_fixture_setup_seconds Fixture setup time, attributed to the test that triggered it.",
+        ]
+        for nodeid, fixtures in self.fixtures.items():
+            for name, scope, ns in fixtures:
+                lines.append(
+                    f"testmu_fixture_setup_seconds{_labels(test=nodeid, fixture=name, scope=scope)} {ns / 1e9:.6f}"
+                )
+
+        lines += [
+            "# TYPE testmu_page_action_seconds gauge",
+            "# HELP testmu_page_action_seconds Page-object action time (goto, login, add_todos, ...).",
+        ]
+        for nodeid, actions in self.page_actions.items():
+            for action, seconds in actions.items():
+                lines.append(f"testmu_page_action_seconds{_labels(test=nodeid, action=action)} {seconds:.6f}")
+
+        per_purpose = {}
+        for _, purpose, seconds, prompt_tokens, completion_tokens in self.llm_calls:
+            stats = per_purpose.setdefault(purpose, [0, 0.0, 0, 0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += prompt_tokens or 0
+            stats[3] += completion_tokens or 0
+        lines += [
+            "# TYPE testmu_llm_latency_seconds summary",
+            "# HELP testmu_llm_latency_seconds LLM call latency per purpose.",
+        ]
+        for purpose, (count, seconds, _, _) in per_purpose.items():
+            lines.append(f"testmu_llm_latency_seconds_count{_labels(purpose=purpose)} {count}")
+            lines.append(f"testmu_llm_latency_seconds_sum{_labels(purpose=purpose)} {seconds:.6f}")
+        lines += [
+            "# TYPE testmu_llm_tokens counter",
+            "# HELP testmu_llm_tokens Tokens used by LLM calls.",
+        ]
+        for purpose, (_, _, prompt_tokens, completion_tokens) in per_purpose.items():
+            lines.append(f"testmu_llm_tokens_total{_labels(purpose=purpose, kind='prompt')} {prompt_tokens}")
+            lines.append(f"testmu_llm_tokens_total{_labels(purpose=purpose, kind='completion')} {completion_tokens}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def collapsed_stacks(self) -> str:
+        """One 'frame;frame;... microseconds' line per leaf; parents hold only their self time."""
+        lines = []
+
+        def emit(frames, ns):
+            if ns > 0:
+                lines.append(f"{';'.join(_frame(f) for f in frames)} {int(ns // 1000)}")
+
+        llm_by_test = {}
+        for nodeid, purpose, seconds, _, _ in self.llm_calls:
+            llm_by_test.setdefault(nodeid, []).append((purpose, int(seconds * 1e9)))
+
+        for nodeid, phases in self.phases.items():
+            path, _, name = nodeid.partition("::")
+            base = ["session", path, name or path]
+            for phase, ns in phases.items():
+                children = []
+                if phase == "setup":
+                    children = [(f"fixture:{f}", fns) for f, _, fns in self.fixtures.get(nodeid, [])]
+                elif phase == "call":
+                    children = [
+                        (f"page:{action}", int(seconds * 1e9))
+                        for action, seconds in self.page_actions.get(nodeid, {}).items()
+                        if action != "open"  # opened by the fixture, i.e. during setup
+                    ]
+                elif phase == "report":
+                    children = [(f"llm:{p}", lns) for p, lns in llm_by_test.get(nodeid, [])]
+                for child, child_ns in children:
+                    emit(base + [phase, child], child_ns)
+                emit(base + [phase], ns - sum(child_ns for _, child_ns in children))
+        for purpose, lns in llm_by_test.get(None, []):
+            emit(["session", f"llm:{purpose}"], lns)
+        return "\n".join(lines) + "\n"
+
+    def pytest_sessionfinish(self, session):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, "metrics.prom"), "w", encoding="utf-8") as f:
+            f.write(self.openmetrics())
+        with open(os.path.join(self.directory, "flamegraph.folded"), "w", encoding="utf-8") as f:
+            f.write(self.collapsed_stacks())
+
+    def pytest_unconfigure(self, config):
+        if self.on_llm_call in llm_helper.llm_call_listeners:
+            llm_helper.llm_call_listeners.remove(self.on_llm_call)
+
+
+def pytest_configure(config):
+    directory = config.getoption("metrics_dir")
+    if directory:
+        recorder = MetricsRecorder(directory)
+        llm_helper.llm_call_listeners.append(recorder.on_llm_call)
+        config.pluginmanager.register(recorder, "metrics_recorder")
@@ -0,0 +1,100 @@
+"""
+Rerun Confirmation - empirical flaky/consistent verdict before any LLM call.
+
+When a test fails, it is rerun K times concurrently, each in its own pytest
+subprocess - a fresh browser + context for UI tests, a fresh HTTP session for
+API tests. If any rerun passes the failure is FLAKY and the slow, paid LLM
+explanation is skipped; only CONSISTENT failures go to the AI explainer.
+
+Reruns do not stream reports, update history or call the LLM themselves, and
+their failure artifacts are archived as <test>-rerun<N>.zip.
+
+Usage:
+    pytest --confirm-runs=3      # default 2 (env: CONFIRM_RUNS), 0 disables
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+
+FLAKY = "FLAKY"
+CONSISTENT = "CONSISTENT"
+INCONCLUSIVE = "INCONCLUSIVE"
+
+# Plugins that must not run inside a confirmation rerun
+_CHILD_BLOCKED_PLUGINS = ["utils.impact", "utils.scheduler", "utils.stream_report", "utils.metrics",
+                          "cacheprovider"]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("rerun-confirm", "rerun failures before explaining them")
+    group.addoption(
+        "--confirm-runs", type=int, default=int(os.getenv("CONFIRM_RUNS", "2")), metavar="K",
+        help="Rerun a failed test K times in parallel, isolated processes before explaining it (0 = off)."
+    )
+    group.addoption(
+        "--confirm-timeout", type=float, default=300, metavar="SECONDS",
+        help="Per-rerun timeout (default: 300)."
+    )
+
+
+@dataclass
+class Confirmation:
+    verdict: str
+    history: list = field(default_factory=list)  # 'pass' / 'fail' / 'error' per rerun
+
+    @property
+    def passes(self) -> int:
+        return self.history.count("pass")
+
+
+def _rerun_command(item, attempt: int, output_dir: str) -> list:
+    config = item.config
+    command = [sys.executable, "-m", "pytest", item.nodeid, "-q", "-o", "addopts=", "--tb=no"]
+    for plugin in _CHILD_BLOCKED_PLUGINS:
+        command += ["-p", f"no:{plugin}"]
+    command += ["--confirm-runs=0", "--no-ai-explain"]
+    if getattr(config, "_artifact_manager", None) is not None:
+        command += [
+            f"--output={output_dir}",
+            f"--artifacts-dir={config.getoption('artifacts_dir')}",
+            f"--artifacts-suffix=-rerun{attempt}",
+        ]
+    if config.getoption("api_memo", False):
+        command.append("--api-memo")
+    return command
+
+
+def _rerun_once(item, attempt: int, timeout: float) -> str:
+    with tempfile.TemporaryDirectory(prefix="rerun-") as output_dir:
+        try:
+            result = subprocess.run(
+                _rerun_command(item, attempt, output_dir),
+                cwd=str(item.config.rootpath),
+                # PYTEST_ADDOPTS (e.g. CI's --impact-base) may name options of blocked plugins
+                env={**os.environ, "PYTEST_ADDOPTS": ""},
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=timeout
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return "error"
+    return {0: "pass", 1: "fail"}.get(result.returncode, "error")
+
+
+def confirm_failure(item) -> Confirmation:
+    """Rerun `item` K times concurrently and derive a flaky/consistent verdict."""
+    runs = item.config.getoption("confirm_runs")
+    timeout = item.config.getoption("confirm_timeout")
+    with ThreadPoolExecutor(max_workers=runs) as pool:
+        history = list(pool.map(lambda attempt: _rerun_once(item, attempt, timeout), range(1, runs + 1)))
+    if "pass" in history:
+        verdict = FLAKY
+    elif all(result == "fail" for result in history):
+        verdict = CONSISTENT
+    else:
+        verdict = INCONCLUSIVE
+    return Confirmation(verdict, history)
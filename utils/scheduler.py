@@ -0,0 +1,209 @@
+"""
+Test Scheduler - pytest plugin for duration-aware ordering and balanced sharding.
+
+1. History: after each run, per-test duration (moving average), run count and
+   failure count are merged into a results file (reports/test_history.json).
+2. Ordering: `--order=longest` runs the slowest tests first, `--order=failfast`
+   runs the tests most likely to fail first (cheapest first on ties).
+3. Sharding: `--shards=N --shard-index=K` splits the suite into N shards of
+   balanced expected runtime (longest-processing-time first). Every test lands
+   in exactly one shard, and the same history always gives the same split.
+4. Merging: every shard must plan from the same history, so in CI the shards
+   read one shared history and `python -m utils.scheduler merge` folds the
+   per-shard results back into it in a single follow-up job.
+
+Usage:
+    pytest --order=longest
+    pytest --shards=3 --shard-index=0    # in CI matrix job 0 of 3
+    python -m utils.scheduler merge base.json shard-*/test_history.json -o reports/test_history.json
+"""
+
+import os
+import json
+import argparse
+import statistics
+import pytest
+
+
+DEFAULT_DURATION = 1.0   # seconds, used when there is no history at all
+SMOOTHING = 0.3          # weight of the newest run in the moving average
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scheduler", "duration-aware ordering and sharding")
+    group.addoption(
+        "--history-file", default="reports/test_history.json", metavar="PATH",
+        help="Per-test duration/failure history (default: reports/test_history.json)."
+    )
+    group.addoption(
+        "--order", choices=["file", "longest", "failfast"], default="file",
+        help="Test order: file (default), longest (slowest first), failfast (likeliest failures first)."
+    )
+    group.addoption(
+        "--shards", type=int, default=1, metavar="N",
+        help="Split the suite into N shards of balanced expected runtime."
+    )
+    group.addoption(
+        "--shard-index", type=int, default=0, metavar="K",
+        help="Which shard (0..N-1) this run executes."
+    )
+
+
+def load_history(path: str) -> dict:
+    """nodeid -> {'duration': seconds, 'runs': int, 'failures': int}; {} if missing/corrupt."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def expected_durations(nodeids, history: dict) -> dict:
+    """Historical duration per test; unknown tests get the median of known ones."""
+    known = [h["duration"] for h in history.values() if h.get("duration") is not None]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {
+        nodeid: history.get(nodeid, {}).get("duration", fallback)
+        for nodeid in nodeids
+    }
+
+
+def failure_rate(entry: dict) -> float:
+    """Laplace-smoothed failure rate, so one run does not mean 0% or 100%."""
+    return (entry.get("failures", 0) + 1) / (entry.get("runs", 0) + 2)
+
+
+def assign_shards(durations: dict, shards: int) -> dict:
+    """
+    nodeid -> shard index, balancing total expected duration per shard.
+    Greedy LPT: longest test first, each onto the currently lightest shard.
+    Ties are broken by nodeid / shard index, so the result is deterministic.
+    """
+    loads = [0.0] * shards
+    assignment = {}
+    for nodeid in sorted(durations, key=lambda n: (-durations[n], n)):
+        target = min(range(shards), key=lambda i: (loads[i], i))
+        assignment[nodeid] = target
+        loads[target] += durations[nodeid]
+    return assignment
+
+
+def merge_histories(base: dict, shard_histories) -> dict:
+    """
+    Fold shard histories that all started from `base` back into one history.
+    A shard only changes the entries of the tests it ran, so each changed entry
+    is taken from its shard; if several shards changed a test, the one with the
+    most runs wins.
+    """
+    merged = {nodeid: dict(entry) for nodeid, entry in base.items()}
+    for history in shard_histories:
+        for nodeid, entry in history.items():
+            if entry == base.get(nodeid):
+                continue
+            current = merged.get(nodeid)
+            if current is None or current == base.get(nodeid) or entry.get("runs", 0) > current.get("runs", 0):
+                merged[nodeid] = dict(entry)
+    return merged
+
+
+def save_history(path: str, history: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    shards = config.getoption("shards")
+    shard_index = config.getoption("shard_index")
+    order = config.getoption("order")
+    if shards < 1 or not 0 <= shard_index < shards:
+        raise pytest.UsageError(f"--shard-index must be in 0..{shards - 1}, got {shard_index}")
+    if shards == 1 and order == "file":
+        return
+
+    history = load_history(config.getoption("history_file"))
+    durations = expected_durations([item.nodeid for item in items], history)
+    summary = []
+
+    if shards > 1:
+        assignment = assign_shards(durations, shards)
+        deselected = [item for item in items if assignment[item.nodeid] != shard_index]
+        items[:] = [item for item in items if assignment[item.nodeid] == shard_index]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        expected = sum(durations[item.nodeid] for item in items)
+        summary.append(
+            f"scheduler: shard {shard_index + 1}/{shards} - {len(items)} tests, ~{expected:.1f}s expected"
+        )
+        config._scheduler_empty_shard = not items
+
+    if order == "longest":
+        items.sort(key=lambda item: (-durations[item.nodeid], item.nodeid))
+    elif order == "failfast":
+        items.sort(key=lambda item: (
+            -failure_rate(history.get(item.nodeid, {})), durations[item.nodeid], item.nodeid
+        ))
+    if order != "file":
+        summary.append(f"scheduler: order={order}")
+    config._scheduler_summary = summary
+
+
+def pytest_report_collectionfinish(config):
+    return getattr(config, "_scheduler_summary", [])
+
+
+def pytest_configure(config):
+    config._scheduler_results = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    results = item.config._scheduler_results
+    entry = results.setdefault(item.nodeid, {"duration": 0.0, "failed": False, "skipped": False})
+    entry["duration"] += report.duration
+    entry["failed"] = entry["failed"] or report.failed
+    entry["skipped"] = entry["skipped"] or report.skipped
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if exitstatus == 5 and getattr(config, "_scheduler_empty_shard", False):
+        session.exitstatus = 0  # more shards than tests is not an error
+    results = getattr(config, "_scheduler_results", {})
+    if not results:
+        return
+    path = config.getoption("history_file")
+    history = load_history(path)
+    for nodeid, result in results.items():
+        if result["skipped"] and not result["failed"]:
+            continue
+        entry = history.setdefault(nodeid, {"duration": result["duration"], "runs": 0, "failures": 0})
+        entry["duration"] = round(
+            (1 - SMOOTHING) * entry["duration"] + SMOOTHING * result["duration"], 4
+        )
+        entry["runs"] += 1
+        entry["failures"] += int(result["failed"])
+    save_history(path, history)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test scheduler history tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="Merge shard histories that started from the same base history")
+    merge.add_argument("base", help="History file every shard started from (may be missing)")
+    merge.add_argument("shards", nargs="*", help="History files written by the shards")
+    merge.add_argument("-o", "--output", default="reports/test_history.json", help="Merged history file")
+    args = parser.parse_args()
+
+    base = load_history(args.base)
+    merged = merge_histories(base, [load_history(path) for path in args.shards])
+    save_history(args.output, merged)
+    print(f"scheduler: merged {len(args.shards)} shard history file(s) into {args.output} ({len(merged)} tests)")
+
+
+if __name__ == "__main__":
+    main()
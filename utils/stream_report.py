@@ -0,0 +1,93 @@
+"""
+Streaming Report - pytest plugin that appends one JSON line per finished test.
+
+Each test is written as soon as its teardown finishes, then dropped from memory:
+    {"nodeid": ..., "outcome": "passed|failed|error|skipped", "duration": ...,
+     "phases": {...}, "ai_explanation": ..., "ai_classification": {...},
+     "ai_artifacts": "reports/artifacts/...zip", "perf": {...}, "longrepr": ...}
+
+Memory stays flat no matter how large the suite is, and a crashed or cancelled
+run still leaves every completed test on disk. Open viewer.html (copied next
+to the JSONL file) to browse the results; it renders them lazily.
+
+Usage:
+    pytest --stream-report=reports/results.jsonl
+"""
+
+import os
+import json
+import shutil
+import time
+import pytest
+
+
+VIEWER_SOURCE = os.path.join(os.path.dirname(__file__), "report_viewer.html")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("stream-report", "streaming JSONL report")
+    group.addoption(
+        "--stream-report", default=None, metavar="PATH",
+        help="Append one JSON record per finished test to PATH (e.g. reports/results.jsonl)."
+    )
+
+
+class StreamReporter:
+    """Writes per-test JSONL records as tests finish; holds only in-flight tests."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pending = {}  # nodeid -> record being built across setup/call/teardown
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        shutil.copyfile(VIEWER_SOURCE, os.path.join(os.path.dirname(path) or ".", "viewer.html"))
+        self._file = open(path, "w", encoding="utf-8")
+        self._write({"type": "session", "started": time.strftime("%Y-%m-%dT%H:%M:%S")})
+
+    def _write(self, record: dict):
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def pytest_runtest_logreport(self, report):
+        record = self._pending.setdefault(report.nodeid, {
+            "type": "test",
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "duration": 0.0,
+            "phases": {},
+        })
+        record["phases"][report.when] = round(report.duration, 4)
+        record["duration"] = round(record["duration"] + report.duration, 4)
+        if report.failed:
+            record["outcome"] = "failed" if report.when == "call" else "error"
+            record["longrepr"] = str(report.longrepr)
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+        for attr in ("ai_explanation", "ai_classification", "ai_artifacts", "ai_rerun_history"):
+            if hasattr(report, attr):
+                record[attr] = getattr(report, attr)
+        perf = {name: value for name, value in report.user_properties}
+        if perf:
+            record["perf"] = perf
+
+        if report.when == "teardown":
+            self._write(self._pending.pop(report.nodeid))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Tests interrupted mid-run never reached teardown; keep what we have
+        for record in self._pending.values():
+            record["outcome"] = "interrupted"
+            self._write(record)
+        self._pending.clear()
+        self._write({"type": "summary", "exitstatus": int(exitstatus),
+                     "finished": time.strftime("%Y-%m-%dT%H:%M:%S")})
+        self._file.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"streaming report: {self.path}")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    path = config.getoption("stream_report")
+    if path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(StreamReporter(path), "stream_reporter")